@@ -47,12 +47,30 @@ import neopixel
 
 import pwmio
 
+try:
+
+    import rotaryio  # Hardware quadrature decoding for the rotary encoder
+
+except ImportError:  # Not in every port's build (the ESP32-C3 has no pulse counter)
+
+    rotaryio = None
+
+import bitmaptools  # C-speed fills and blits for the drawn-in-bitmap text
+
 import storage  # For saving high scores to flash
 
+import struct  # Binary high score records
+
+from supervisor import ticks_ms  # Integer millisecond clock (wraps, see ticks_diff)
+
 import microcontroller
 
+from micropython import const  # Inline integer constants into bytecode
+
 from adafruit_display_text import label
 
+from adafruit_bus_device.i2c_device import I2CDevice
+
 import i2cdisplaybus
 
 import adafruit_displayio_ssd1306
@@ -67,41 +85,61 @@ import adafruit_adxl34x
 
 # ==============================================================================
 
+# Integer settings are wrapped in const() so the compiler inlines them where
+
+# they are used instead of looking them up in the module globals every time
+
 # Display dimensions
 
-SCREEN_WIDTH = 128
+SCREEN_WIDTH = const(128)
 
-SCREEN_HEIGHT = 64
+SCREEN_HEIGHT = const(64)
 
  
 
 # Claw appearance settings
 
-CLAW_WIDTH = 40  # Width of the claw text in pixels
+CLAW_WIDTH = const(40)  # Width of the claw text in pixels
 
-CLAW_Y1_BASE = 2  # Top line baseline Y position
+CLAW_Y1_BASE = const(2)  # Top line baseline Y position
 
-CLAW_Y2_BASE = 12  # Middle line baseline Y position
+CLAW_Y2_BASE = const(12)  # Middle line baseline Y position
 
-CLAW_Y3_BASE = 22  # Bottom line (grabber) baseline Y position
+CLAW_Y3_BASE = const(22)  # Bottom line (grabber) baseline Y position
 
  
 
 # Claw movement settings
 
-INITIAL_CLAW_SPEED = 3  # Starting speed (pixels per frame)
+# Claw position and speed are 8.8 fixed-point integers (pixels * 256) so the
+
+# per-frame fall is integer math; shift right by CLAW_FRAC_BITS for pixels
+
+CLAW_FRAC_BITS = const(8)  # Fractional bits in claw position/speed
+
+INITIAL_CLAW_SPEED = const(3 << 8)  # Starting speed (3 pixels per frame)
+
+CLAW_SPEED_STEP = const(64)  # Speed increase per level (0.25 pixels per frame)
+
+MEDIUM_SPEED_BONUS = const(102)  # Extra starting speed on MEDIUM (~0.4 pixels per frame)
 
-CLAW_SPEED_STEP = 0.25  # Speed increase per level
+HARD_SPEED_BONUS = const(205)  # Extra starting speed on HARD (~0.8 pixels per frame)
 
-CLAW_RESET_Y = -10  # Y position when claw is off-screen (hidden)
+CLAW_RESET_Y = const(-10)  # Y position when claw is off-screen (hidden)
 
  
 
 # Multiplayer claw drop animation settings
 
-DROP_STEPS = 10  # Number of steps in drop animation
+DROP_STEPS = const(10)  # Number of steps in drop animation
 
-DROP_STEP_PIXELS = 3  # Pixels moved per step
+DROP_STEP_PIXELS = const(3)  # Pixels moved per step
+
+DROP_STEP_MS = const(30)  # Time between drop animation steps
+
+DROP_HOLD_MS = const(150)  # Pause at the bottom before rising
+
+DROP_REARM_MS = const(100)  # Pause after rising before the next drop can start
 
  
 
@@ -111,13 +149,53 @@ ACCEL_MIN = -9.0  # Minimum tilt value
 
 ACCEL_MAX = 9.0  # Maximum tilt value
 
+# Same range in raw ADXL345 counts (4 mg per count in full-resolution mode)
+
+ADXL345_MS2_PER_COUNT = 0.004 * 9.80665
+
+TILT_RAW_MIN = int(ACCEL_MIN / ADXL345_MS2_PER_COUNT)
+
+TILT_RAW_MAX = int(ACCEL_MAX / ADXL345_MS2_PER_COUNT)
+
+# Linear tilt -> player step mapping
+
+# (full left tilt = -PLAYER_MAX_STEP, full right = +PLAYER_MAX_STEP)
+
+PLAYER_MAX_STEP = const(10)  # Pixels moved per frame at full tilt
+
+TILT_SCALE = (2 * PLAYER_MAX_STEP) / (TILT_RAW_MAX - TILT_RAW_MIN)
+
+TILT_OFFSET = -PLAYER_MAX_STEP - TILT_RAW_MIN * TILT_SCALE
+
+# The step only takes 2 * PLAYER_MAX_STEP + 1 values, so it is tabulated for every
+
+# raw count in the tilt range: index with (tilt_x - TILT_RAW_MIN), subtract
+
+# PLAYER_MAX_STEP (bytes can't hold negative values) and no float math is left
+
+TILT_STEP_LUT = bytes(int(t * TILT_SCALE + TILT_OFFSET) + PLAYER_MAX_STEP
+
+                      for t in range(TILT_RAW_MIN, TILT_RAW_MAX + 1))
+
+TILT_READ_INTERVAL = const(2)  # Read the accelerometer every Nth frame (tilt changes slowly)
+
+# Opponent aim (m/s^2, ACCEL_MIN..ACCEL_MAX) -> claw x (0..SCREEN_WIDTH - CLAW_WIDTH),
+
+# precomputed the same way
+
+AIM_SCALE = (SCREEN_WIDTH - CLAW_WIDTH) / (ACCEL_MAX - ACCEL_MIN)
+
+AIM_OFFSET = -ACCEL_MIN * AIM_SCALE
+
  
 
 # Player settings
 
-PLAYER_WIDTH = 8  # Width of player character in pixels
+PLAYER_WIDTH = const(8)  # Width of player character in pixels
 
-PLAYER_Y = 52  # Y position of player (near bottom of screen)
+PLAYER_Y = const(52)  # Y position of player (near bottom of screen)
+
+CLAW_PASSED_Y = const((PLAYER_Y + 8) << 8)  # Fixed-point claw offset once it has fallen past the player
 
  
 
@@ -133,6 +211,8 @@ LEVEL_DATA = [
 
 ]
 
+LEVEL_DATA_MS = [int(seconds * 1000) for seconds in LEVEL_DATA]  # Same, in milliseconds for ticks_ms() math
+
  
 
 # Available game modes
@@ -141,6 +221,20 @@ DIFFICULTY_OPTIONS = ["EASY", "MEDIUM", "HARD", "MULTIPLAYER"]
 
  
 
+# Main loop pacing (ms per frame, measured from the top of the frame, so the
+
+# time spent drawing is taken out of the sleep). Gameplay runs at 50 Hz; the
+
+# menu and score screens only wait for the encoder and button, so they wake ~20 Hz.
+
+# Without rotaryio the encoder pins are polled, so those screens keep the full rate
+
+FRAME_MS = const(20)
+
+IDLE_FRAME_MS = 50 if rotaryio else FRAME_MS
+
+ 
+
 # Hardware pin assignments
 
 ROT_BTN_PIN = board.D0  # Rotary encoder button
@@ -153,7 +247,7 @@ ROT_B_PIN = board.D9  # Rotary encoder B phase
 
 LED_PIN = board.D1  # NeoPixel LED for health display
 
-NUM_LEDS = 1  # Number of NeoPixels connected
+NUM_LEDS = const(1)  # Number of NeoPixels connected
 
  
 
@@ -161,45 +255,13 @@ SPEAKER_PIN = board.D10  # PWM speaker/buzzer
 
  
 
-# ==============================================================================
-
-# UTILITY FUNCTIONS
-
-# ==============================================================================
-
-def map_range(x, in_min, in_max, out_min, out_max):
-
-    """
-    Map a value from one range to another (like Arduino's map function)
-    
-    Args:
-        x: Input value to map
-        in_min: Minimum of input range
-        in_max: Maximum of input range
-        out_min: Minimum of output range
-        out_max: Maximum of output range
-    
-    Returns:
-        Mapped value in output range
-    """
-
-    if in_min == in_max:
-
-        return out_min
-
-    # Clamp input to range
-
-    if x < in_min:
+# I2C bus clock shared by the OLED and accelerometer (Hz)
 
-        x = in_min
+# 400 kHz fast mode is the highest rate the ADXL345 is rated for
 
-    if x > in_max:
+# (a full 1 KB display flush takes ~23 ms at 400 kHz versus ~90 ms at 100 kHz)
 
-        x = in_max
-
-    # Linear interpolation
-
-    return out_min + (out_max - out_min) * (x - in_min) / (in_max - in_min)
+I2C_FREQUENCY = const(400000)
 
  
 
@@ -215,7 +277,7 @@ displayio.release_displays()
 
 # Initialize I2C bus for display and accelerometer
 
-i2c = busio.I2C(board.SCL, board.SDA)
+i2c = busio.I2C(board.SCL, board.SDA, frequency=I2C_FREQUENCY)
 
  
 
@@ -225,7 +287,21 @@ display_bus = i2cdisplaybus.I2CDisplayBus(i2c, device_address=0x3C)
 
 display = adafruit_displayio_ssd1306.SSD1306(display_bus, width=SCREEN_WIDTH, height=SCREEN_HEIGHT)
 
- 
+# Refresh manually once per frame instead of after every label change
+
+display.auto_refresh = False
+
+_frame_dirty = True  # Something on screen changed since the last game loop refresh
+
+# The SSD1306 driver already runs the panel in horizontal addressing mode and
+
+# displayio sends each dirty area as one column/page-windowed data burst, so the
+
+# claw sprite goes out in a single transfer. Don't write to 0x3C directly:
+
+# displayio owns the panel and would overwrite (or race) hand-written pixels.
+
+
 
 # Initialize accelerometer (ADXL345) with ±2g range
 
@@ -233,6 +309,35 @@ accelerometer = adafruit_adxl34x.ADXL345(i2c)
 
 accelerometer.range = adafruit_adxl34x.Range.RANGE_2_G
 
+# Direct handle on the ADXL345 for the per-frame tilt read (skips the driver)
+
+ADXL345_ADDRESS = const(0x53)
+
+ADXL345_REG_DATAX0 = b"\x32"  # DATAX0; DATAX1 follows it
+
+adxl_device = I2CDevice(i2c, ADXL345_ADDRESS)
+
+_tilt_buf = bytearray(2)  # Reused for every read to avoid allocations
+
+
+
+def read_tilt_x():
+
+    """
+    Read only the X axis from the ADXL345 data registers in one burst
+    
+    Returns:
+        Signed X acceleration in raw counts (see ADXL345_MS2_PER_COUNT)
+    """
+
+    with adxl_device:
+
+        adxl_device.write_then_readinto(ADXL345_REG_DATAX0, _tilt_buf)
+
+    raw = _tilt_buf[0] | (_tilt_buf[1] << 8)
+
+    return raw - 65536 if raw & 0x8000 else raw
+
  
 
 # Initialize rotary encoder button (active low with pull-up)
@@ -243,25 +348,75 @@ rot_btn.switch_to_input(pull=digitalio.Pull.UP)
 
 last_btn_state = rot_btn.value  # Track previous button state for edge detection
 
+BUTTON_DEBOUNCE_MS = const(50)  # Ignore presses closer together than this (milliseconds)
+
  
 
-# Initialize rotary encoder A and B phases (active low with pull-up)
+# Initialize rotary encoder A and B phases. rotaryio decodes them in the background
+
+# (one count per detent); ports built without it poll the pins instead
+
+class _PolledEncoder:
+
+    """
+
+    digitalio stand-in for rotaryio.IncrementalEncoder
+
+    
+
+    Counts one step per falling edge of A, with B giving the direction, each
+
+    time position is read. The menu and initial entry read it every frame.
+
+    """
+
+    def __init__(self, pin_a, pin_b):
+
+        self._a = digitalio.DigitalInOut(pin_a)
+
+        self._a.switch_to_input(pull=digitalio.Pull.UP)
+
+        self._b = digitalio.DigitalInOut(pin_b)
+
+        self._b.switch_to_input(pull=digitalio.Pull.UP)
+
+        self._last_a = self._a.value
+
+        self._position = 0
+
+    @property
 
-rot_a = digitalio.DigitalInOut(ROT_A_PIN)
+    def position(self):
 
-rot_a.switch_to_input(pull=digitalio.Pull.UP)
+        a = self._a.value
 
-rot_b = digitalio.DigitalInOut(ROT_B_PIN)
+        if a != self._last_a:
 
-rot_b.switch_to_input(pull=digitalio.Pull.UP)
+            if not a:
 
-rot_last_state = rot_a.value  # Track previous A state for rotation detection
+                self._position += 1 if self._b.value else -1
+
+            self._last_a = a
+
+        return self._position
+
+ 
+
+if rotaryio:
+
+    encoder = rotaryio.IncrementalEncoder(ROT_A_PIN, ROT_B_PIN)
+
+else:
+
+    encoder = _PolledEncoder(ROT_A_PIN, ROT_B_PIN)
+
+rot_last_position = encoder.position  # Track previous position for rotation detection
 
  
 
 # Initialize NeoPixel LED for health bar display
 
-pixels = neopixel.NeoPixel(LED_PIN, NUM_LEDS, brightness=0.3, auto_write=True)
+pixels = neopixel.NeoPixel(LED_PIN, NUM_LEDS, brightness=0.3, auto_write=False)  # Written with show()
 
  
 
@@ -273,88 +428,166 @@ speaker.duty_cycle = 0  # Start silent
 
  
 
+# ==============================================================================
+
+# TIMING
+
+# ==============================================================================
+
+# All game timing uses integer supervisor.ticks_ms() values. They wrap around
+
+# every 2**29 ms, so always compare them with ticks_diff()/ticks_add().
+
+TICKS_PERIOD = const(1 << 29)
+
+TICKS_MAX = const((1 << 29) - 1)
+
+TICKS_HALFPERIOD = const(1 << 28)
+
+ 
+
+def ticks_diff(end, start):
+
+    """Signed milliseconds from start to end, correct across a ticks_ms() wrap"""
+
+    diff = (end - start) & TICKS_MAX
+
+    return ((diff + TICKS_HALFPERIOD) & TICKS_MAX) - TICKS_HALFPERIOD
+
+ 
+
+def ticks_add(ticks, delta):
+
+    """ticks_ms() value delta milliseconds after ticks"""
+
+    return (ticks + delta) % TICKS_PERIOD
+
+ 
+
+# ticks_ms() starts about 65 s before its first wrap, so a stamp of 0 would read
+
+# as far in the future (ticks_diff(now, 0) < 0) until then. Event stamps start
+
+# one full window in the past instead, so the first press or hit always counts
+
+last_btn_press_ms = ticks_add(ticks_ms(), -(BUTTON_DEBOUNCE_MS + 1))  # ticks_ms() of last accepted press (for debounce)
+
+ 
+
 # ==============================================================================
 
 # SOUND EFFECTS SYSTEM
 
 # ==============================================================================
 
-def play_tone(frequency, duration, duty_cycle=32768):
+# Tones are queued and played in the background: the main loop calls
+
+# update_tones() every iteration, which switches the PWM output whenever the
+
+# current tone's end time has passed. Nothing here ever sleeps.
+
+TONE_DUTY_CYCLE = const(32768)  # PWM duty cycle (32768 = 50% = medium volume)
+
+TONE_GAP_MS = const(10)  # Brief pause between tones (milliseconds)
+
+_tone_queue = []  # Pending tones as (frequency, end ticks_ms), oldest first
+
+_current_tone = 0  # Frequency currently driving the speaker (0 = silent)
+
+
+
+def enqueue_tones(notes):
 
     """
-    Play a tone at specified frequency for given duration
+    Queue a sequence of tones to play after anything already queued
     
     Args:
-        frequency: Tone frequency in Hz (0 for silence)
-        duration: How long to play in seconds
-        duty_cycle: PWM duty cycle (32768 = 50% = medium volume)
+        notes: List of (frequency, duration) pairs; frequency in Hz
+               (0 for silence), duration in seconds
     """
 
-    if frequency > 0:
+    now = ticks_ms()
 
-        speaker.frequency = frequency
+    end_time = _tone_queue[-1][1] if _tone_queue else now
 
-        speaker.duty_cycle = duty_cycle
+    for frequency, duration in notes:
 
-    time.sleep(duration)
+        end_time = ticks_add(end_time, int(duration * 1000))
 
-    speaker.duty_cycle = 0  # Silence
+        _tone_queue.append((frequency, end_time))
 
-    time.sleep(0.01)  # Brief pause between tones
+        end_time = ticks_add(end_time, TONE_GAP_MS)
 
- 
+        _tone_queue.append((0, end_time))  # Silence between tones
 
-def startup_sound():
+    update_tones(now)
 
-    """Play ascending cheerful startup tune (C5→E5→G5→C6)"""
 
-    play_tone(523, 0.1)  # C5
 
-    play_tone(659, 0.1)  # E5
+def update_tones(now):
+
+    """
+    Drop expired tones and drive the speaker with the current one
+    
+    Args:
+        now: Current ticks_ms() value
+    """
+
+    global _current_tone
+
+    while _tone_queue and ticks_diff(_tone_queue[0][1], now) <= 0:
 
-    play_tone(784, 0.15) # G5
+        _tone_queue.pop(0)
 
-    play_tone(1047, 0.2) # C6
+    frequency = _tone_queue[0][0] if _tone_queue else 0
 
- 
+    if frequency == _current_tone:
 
-def game_start_sound():
+        return  # Speaker already in the right state
 
-    """Play quick energetic game start sound (A5→C6→E6)"""
+    _current_tone = frequency
+
+    if frequency > 0:
 
-    play_tone(880, 0.08)  # A5
+        speaker.frequency = frequency
+
+        speaker.duty_cycle = TONE_DUTY_CYCLE
 
-    play_tone(1047, 0.08) # C6
+    else:
 
-    play_tone(1319, 0.12) # E6
+        speaker.duty_cycle = 0  # Silence
 
  
 
-def game_over_sound():
+def startup_sound():
 
-    """Play descending sad game over tune (E5→D5→C5→G4)"""
+    """Play ascending cheerful startup tune (C5→E5→G5→C6)"""
+
+    enqueue_tones([(523, 0.1), (659, 0.1), (784, 0.15), (1047, 0.2)])
 
-    play_tone(659, 0.15)  # E5
+ 
 
-    play_tone(587, 0.15)  # D5
+def game_start_sound():
 
-    play_tone(523, 0.15)  # C5
+    """Play quick energetic game start sound (A5→C6→E6)"""
 
-    play_tone(392, 0.3)   # G4
+    enqueue_tones([(880, 0.08), (1047, 0.08), (1319, 0.12)])
 
  
 
-def win_sound():
+def game_over_sound():
 
-    """Play victory fanfare (G5→B5→D6→G6)"""
+    """Play descending sad game over tune (E5→D5→C5→G4)"""
+
+    enqueue_tones([(659, 0.15), (587, 0.15), (523, 0.15), (392, 0.3)])
 
-    play_tone(784, 0.1)   # G5
+ 
 
-    play_tone(988, 0.1)   # B5
+def win_sound():
 
-    play_tone(1175, 0.1)  # D6
+    """Play victory fanfare (G5→B5→D6→G6)"""
 
-    play_tone(1568, 0.3)  # G6
+    enqueue_tones([(784, 0.1), (988, 0.1), (1175, 0.1), (1568, 0.3)])
 
  
 
@@ -384,51 +617,132 @@ splash.append(title_label)
 
  
 
-# Level label (top-left, yellow) - shows current level number
+# Glyph cell size of the built-in font, for text drawn straight into bitmaps
+
+glyph_width, glyph_height = terminalio.FONT.get_bounding_box()[:2]
+
+ 
+
+def draw_text_into_bitmap(bitmap, text, x, y):
+
+    """
+    Copy terminalio.FONT glyphs for text into a bitmap (color index 1)
+    
+    Each glyph is one blit from the font's tile sheet; the font's background
+    pixels are skipped, so whatever is already in the bitmap shows through.
+    
+    Args:
+        bitmap: Destination displayio.Bitmap
+        text: Single line of text to draw
+        x: Left edge of the first character in the bitmap
+        y: Top edge of the text line in the bitmap
+    """
+
+    for char in text:
+
+        glyph = terminalio.FONT.get_glyph(ord(char))
+
+        if glyph is not None:
 
-level_label = label.Label(terminalio.FONT, text="", color=0xFFFF00)
+            # Glyphs are tiles in the font's shared bitmap
 
-level_label.anchored_position = (0, 0)
+            tiles_per_row = glyph.bitmap.width // glyph.width
 
-level_label.anchor_point = (0.0, 0.0)
+            tile_x = (glyph.tile_index % tiles_per_row) * glyph.width
 
-splash.append(level_label)
+            tile_y = (glyph.tile_index // tiles_per_row) * glyph.height
+
+            bitmaptools.blit(bitmap, glyph.bitmap, x, y,
+
+                             x1=tile_x, y1=tile_y, x2=tile_x + glyph.width, y2=tile_y + glyph.height,
+
+                             skip_source_index=0)
+
+        x += glyph_width
 
  
 
-# Timer label (below level, white) - shows time remaining
+# HUD strip: level and timer down the left, lives and score down the right,
+
+# all drawn into one bitmap so a HUD change is one TileGrid's dirty area
+
+# instead of a label rebuilding its glyphs
+
+HUD_ROW_PITCH = const(10)  # Pixels from the first HUD row to the second
+
 
-timer_label = label.Label(terminalio.FONT, text="", color=0xFFFFFF)
+HUD_RIGHT_EDGE = SCREEN_WIDTH - 2  # Right-hand fields end here
 
-timer_label.anchor_point = (0.0, 0.0)
+HUD_LEFT = const(0)  # Field alignments for draw_hud_field()
 
-timer_label.anchored_position = (0, 10)
+HUD_RIGHT = const(1)
 
-splash.append(timer_label)
+hud_field_widths = [0, 0, 0, 0]  # Pixel width of each field's drawn text, by row * 2 + align
 
  
 
-# Lives label (top-right, white) - shows remaining lives
+hud_bitmap = displayio.Bitmap(SCREEN_WIDTH, HUD_ROW_PITCH + glyph_height, 2)
 
-lives_label = label.Label(terminalio.FONT, text="", color=0xFFFFFF)
+hud_palette = displayio.Palette(2)
 
-lives_label.anchor_point = (1.0, 0.0)
+hud_palette[0] = 0x000000
 
-lives_label.anchored_position = (SCREEN_WIDTH - 2, 0)
+hud_palette[1] = 0xFFFFFF
 
-splash.append(lives_label)
+hud_palette.make_transparent(0)
+
+hud_grid = displayio.TileGrid(hud_bitmap, pixel_shader=hud_palette)
+
+splash.append(hud_grid)
 
  
 
-# Score label (below lives, white) - shows current score
+def draw_hud_field(text, row, align):
+
+    """
+    Replace the text of one HUD field
+    
+    Args:
+        text: New field text
+        row: 0 for the top HUD row, 1 for the one below it
+        align: HUD_LEFT or HUD_RIGHT
+    """
+
+    top = row * HUD_ROW_PITCH
 
-score_label = label.Label(terminalio.FONT, text="", color=0xFFFFFF)
+    field = row * 2 + align
 
-score_label.anchor_point = (1.0, 0.0)
+    width = len(text) * glyph_width
 
-score_label.anchored_position = (SCREEN_WIDTH - 2, 10)
+    # Clear whichever is wider, the old text or the new, so a field that
 
-splash.append(score_label)
+    # grows (a 6-digit score) or shrinks again leaves no stale pixels
+
+    clear_width = max(width, hud_field_widths[field])
+
+    hud_field_widths[field] = width
+
+    if align == HUD_LEFT:
+
+        left = 0
+
+        x = 0
+
+    else:
+
+        left = HUD_RIGHT_EDGE - clear_width
+
+        x = HUD_RIGHT_EDGE - width
+
+    # The top row clears only its own pitch, so the row below keeps its pixels;
+
+    # the bottom row clears down to the bitmap's edge
+
+    bottom = hud_bitmap.height if row else HUD_ROW_PITCH
+
+    bitmaptools.fill_region(hud_bitmap, left, top, left + clear_width, bottom, 0)
+
+    draw_text_into_bitmap(hud_bitmap, text, x, top)
 
  
 
@@ -510,54 +824,103 @@ splash.append(message_label)
 
 #   |  |    (bottom - grabber claws)
 
+# The three lines are painted once into a single bitmap and shown as one
+
+# TileGrid sprite, so moving the claw touches one dirty rectangle, not three.
+
 start_claw_x = (SCREEN_WIDTH - CLAW_WIDTH) // 2  # Initial centered position
 
- 
+CLAW_LINES = ("   ||", "  ====", "  |  |")
 
-# Three lines that make up the claw visual
+CLAW_LINE_Y_BASES = (CLAW_Y1_BASE, CLAW_Y2_BASE, CLAW_Y3_BASE)
 
-claw_line1 = label.Label(terminalio.FONT, text="   ||", color=0xFFFFFF, x=start_claw_x, y=CLAW_Y1_BASE)
+ 
 
-claw_line2 = label.Label(terminalio.FONT, text="  ====", color=0xFFFFFF, x=start_claw_x, y=CLAW_Y2_BASE)
+# Label y positions are the middle of a text line, so the sprite's top edge
 
-claw_line3 = label.Label(terminalio.FONT, text="  |  |", color=0xFFFFFF, x=start_claw_x, y=CLAW_Y3_BASE)
+# sits half a glyph above the first line
 
-splash.append(claw_line1)
+CLAW_SPRITE_TOP = CLAW_Y1_BASE - glyph_height // 2
 
-splash.append(claw_line2)
+CLAW_SPRITE_HEIGHT = CLAW_Y3_BASE - CLAW_Y1_BASE + glyph_height
 
-splash.append(claw_line3)
+CLAW_GRABBER_Y = CLAW_Y3_BASE - CLAW_SPRITE_TOP  # Grabber line middle, relative to sprite top
 
  
 
-def set_claw_y(offset):
+claw_bitmap = displayio.Bitmap(CLAW_WIDTH, CLAW_SPRITE_HEIGHT, 2)
 
-    """
-    Move all three claw lines vertically by offset amount
-    
-    Args:
-        offset: Y position offset from base positions
-    """
+for claw_text, line_y in zip(CLAW_LINES, CLAW_LINE_Y_BASES):
 
-    claw_line1.y = CLAW_Y1_BASE + offset
+    draw_text_into_bitmap(claw_bitmap, claw_text, 0, line_y - CLAW_Y1_BASE)
 
-    claw_line2.y = CLAW_Y2_BASE + offset
+claw_palette = displayio.Palette(2)
 
-    claw_line3.y = CLAW_Y3_BASE + offset
+claw_palette[0] = 0x000000
 
- 
+claw_palette[1] = 0xFFFFFF
 
-# ==============================================================================
+claw_palette.make_transparent(0)
 
-# PLAYER CHARACTER
+claw_sprite = displayio.TileGrid(claw_bitmap, pixel_shader=claw_palette,
 
-# ==============================================================================
+                                 x=start_claw_x, y=CLAW_SPRITE_TOP)
 
-player_x = SCREEN_WIDTH // 2  # Start in center of screen
+splash.append(claw_sprite)
 
-player_label = label.Label(terminalio.FONT, text="*", color=0xFFFFFF, x=player_x, y=PLAYER_Y)
+ 
 
-splash.append(player_label)
+def set_claw_x(x):
+
+    """
+    Move the claw sprite horizontally, skipping the write if it is already there
+    
+    Args:
+        x: Left edge of the claw in pixels
+    """
+
+    global _frame_dirty
+
+    if claw_sprite.x != x:
+
+        claw_sprite.x = x
+
+        _frame_dirty = True
+
+
+
+def set_claw_y(offset):
+
+    """
+    Move the claw sprite vertically by offset amount
+    
+    Args:
+        offset: Y position offset from base positions
+    """
+
+    global _frame_dirty
+
+    y = CLAW_SPRITE_TOP + offset
+
+    if claw_sprite.y != y:
+
+        claw_sprite.y = y
+
+        _frame_dirty = True
+
+ 
+
+# ==============================================================================
+
+# PLAYER CHARACTER
+
+# ==============================================================================
+
+player_x = SCREEN_WIDTH // 2  # Start in center of screen
+
+player_label = label.Label(terminalio.FONT, text="*", color=0xFFFFFF, x=player_x, y=PLAYER_Y)
+
+splash.append(player_label)
 
  
 
@@ -579,15 +942,57 @@ fire_flag = False  # Flag set when opponent fires the claw
 
 last_player_x = 0  # Last sent player position (to avoid redundant sends)
 
+_pos_buf = bytearray(b"P:000\n")  # Reused position message, digits filled in per send
+
+POSITION_SEND_MIN_DELTA = const(2)  # Pixels moved before a new position is sent (filters tilt jitter)
+
+# Incoming binary frames from the shooter (ASCII "AIM:"/"FIRE:1" lines are
+
+# still understood so older shooter firmware keeps working). Each frame is a
+
+# header byte, then the payload length, then the payload:
+
+#   0xA1 0x01 <int8>  aim, value is opponent tilt * AIM_FRAME_SCALE
+
+#   0xF1 0x00         fire
+
+# The length byte is checked against the header, so after a dropped byte a
+
+# payload that happens to read 0xA1 or 0xF1 is skipped instead of obeyed
+
+# (the byte after a payload is a header, never the matching length).
+
+AIM_FRAME = const(0xA1)
+
+AIM_FRAME_LEN = const(1)
+
+FIRE_FRAME = const(0xF1)
+
+FIRE_FRAME_LEN = const(0)
+
+AIM_FRAME_SCALE = const(12)
+
+UART_RX_LIMIT = const(64)  # Receive buffer size; dropped if no frame/line completes within it
+
+_rx_buf = bytearray(UART_RX_LIMIT)  # Fixed receive buffer, reused for every read
+
+_rx_view = memoryview(_rx_buf)  # Lets readinto() fill the free tail without copying
+
+_rx_len = 0  # Bytes in _rx_buf not yet parsed (partial line or frame)
+
  
 
 def init_multiplayer_uart():
 
-    global uart, multiplayer_active, opponent_aim_raw, fire_flag
+    global uart, multiplayer_active, opponent_aim_raw, fire_flag, _rx_len
 
     try:
 
-        uart = busio.UART(tx=board.D6, rx=board.D7, baudrate=115200, timeout=0.01)
+        # process_uart() only ever asks for bytes that are already waiting, so a
+
+        # zero timeout costs nothing and guarantees a read can never stall a frame
+
+        uart = busio.UART(tx=board.D6, rx=board.D7, baudrate=115200, timeout=0)
 
         multiplayer_active = True
 
@@ -595,6 +1000,8 @@ def init_multiplayer_uart():
 
         fire_flag = False
 
+        _rx_len = 0
+
         print("Multiplayer UART initialized.")
 
     except Exception as e:
@@ -631,55 +1038,208 @@ def process_uart():
 
     """Receive claw position and fire commands"""
 
-    global opponent_aim_raw, fire_flag
+    global opponent_aim_raw, fire_flag, _rx_len
 
     if not multiplayer_active or not uart:
 
         return
 
-    # Read all available data to get latest state
+    # Read what is waiting straight into the free end of the receive buffer
 
-    while True:
+    # (never more than is waiting, so readinto() doesn't block on the timeout)
 
-        try:
+    try:
 
-            data = uart.readline()
+        waiting = min(uart.in_waiting, UART_RX_LIMIT - _rx_len)
 
-        except Exception:
+        count = uart.readinto(_rx_view[_rx_len:_rx_len + waiting]) if waiting else 0
 
-            return
+    except Exception:
 
-        if not data:
+        return
 
-            break
+    if not count:
 
-        try:
+        return
 
-            msg = data.decode().strip()
+    _rx_len += count
 
-        except Exception:
 
-            continue
+
+    # Scan the buffer byte by byte; start marks the beginning of the current ASCII line
+
+    start = 0
+
+    i = 0
+
+    end = _rx_len
+
+    while i < end:
+
+        b = _rx_buf[i]
+
+        if b == AIM_FRAME or b == FIRE_FRAME:
+
+            if i + 1 >= end:
+
+                break  # Length byte not here yet, keep the frame for next time
+
+            if _rx_buf[i + 1] != (AIM_FRAME_LEN if b == AIM_FRAME else FIRE_FRAME_LEN):
+
+                i += 1  # Not a frame start (a stray payload byte), resync on the next byte
+
+            elif b == FIRE_FRAME:
+
+                fire_flag = True
+
+                i += 2
+
+                start = i
+
+            elif i + 2 >= end:
+
+                break  # Payload byte not here yet, keep the frame for next time
+
+            else:
+
+                val = _rx_buf[i + 2]
+
+                opponent_aim_raw = (val - 256 if val & 0x80 else val) / AIM_FRAME_SCALE
+
+                i += 3
+
+                start = i
+
+        elif b == 0x0A:  # Newline ends a legacy ASCII line
+
+            parse_uart_line(start, i)
+
+            i += 1
+
+            start = i
+
+        else:
+
+            i += 1
+
+
+
+    # Move the unparsed tail to the front of the buffer
+
+    tail = _rx_len - start
+
+    if tail == UART_RX_LIMIT:
+
+        tail = 0  # Full of garbage with no frame or newline, start over
+
+    elif start:
+
+        for j in range(tail):
+
+            _rx_buf[j] = _rx_buf[start + j]
+
+    _rx_len = tail
+
+
+
+def parse_decimal(start, end):
+
+    """
+    Parse a plain ASCII decimal ("-3.25") straight out of _rx_buf
+    
+    Args:
+        start: Index of the first character in _rx_buf
+        end: Index just past the last character
+        
+    Returns:
+        The value as a float, or None if it isn't a plain decimal
+    """
+
+    negative = start < end and _rx_buf[start] == 0x2D  # '-'
+
+    if negative:
+
+        start += 1
+
+    if start >= end:
+
+        return None
+
+    value = 0
+
+    scale = 1
+
+    seen_point = False
+
+    for i in range(start, end):
+
+        b = _rx_buf[i]
+
+        if 0x30 <= b <= 0x39:  # '0'-'9'
+
+            value = value * 10 + b - 0x30
+
+            if seen_point:
+
+                scale *= 10
+
+        elif b == 0x2E and not seen_point:  # '.'
+
+            seen_point = True
+
+        else:
+
+            return None
+
+    value = value / scale
+
+    return -value if negative else value
 
  
 
-        if msg.startswith("AIM:"):
+def parse_uart_line(start, end):
 
-            try:
+    """
+    Handle one legacy ASCII message ("AIM:<float>" or "FIRE:1") in place
+    
+    Args:
+        start: Index of the first byte of the line in _rx_buf
+        end: Index of the terminating newline in _rx_buf
+    """
+
+    global opponent_aim_raw, fire_flag
+
+    if end > start and _rx_buf[end - 1] == 0x0D:
+
+        end -= 1  # Ignore a CR from CRLF line endings
 
-                val_str = msg.split(":",1)[1]
+    # Dispatch on the first byte so the common AIM line is never sliced out
+
+    first = _rx_buf[start] if end > start else 0
+
+    if (first == 0x41 and end - start > 4 and _rx_buf[start + 1] == 0x49  # "AIM:"
+
+            and _rx_buf[start + 2] == 0x4D and _rx_buf[start + 3] == 0x3A):
+
+        value = parse_decimal(start + 4, end)
+
+        if value is None:
+
+            # Anything unusual (exponent, '+', spaces) goes through the full parser
+
+            try:
 
-                val = float(val_str)
+                value = float(bytes(_rx_buf[start + 4:end]))
 
-                opponent_aim_raw = val
+            except ValueError:
 
-            except Exception:
+                return
 
-                pass
+        opponent_aim_raw = value
 
-        elif msg == "FIRE:1":
+    elif first == 0x46 and _rx_buf[start:end] == b"FIRE:1":  # "F"
 
-            fire_flag = True
+        fire_flag = True
 
  
 
@@ -693,15 +1253,23 @@ def send_player_position():
 
         return
 
-    # Only send if changed
+    # Only send once the player has really moved (one pixel of tilt noise isn't worth a message)
 
-    if abs(player_x - last_player_x) >= 1:
+    moved = player_x - last_player_x
+
+    if moved >= POSITION_SEND_MIN_DELTA or moved <= -POSITION_SEND_MIN_DELTA:
 
         try:
 
-            msg = f"P:{player_x}\n"
+            # Patch the three ASCII digits in place (0-127 always fits)
+
+            _pos_buf[2] = 48 + player_x // 100
+
+            _pos_buf[3] = 48 + player_x // 10 % 10
+
+            _pos_buf[4] = 48 + player_x % 10
 
-            uart.write(msg.encode())
+            uart.write(_pos_buf)
 
             last_player_x = player_x
 
@@ -731,9 +1299,9 @@ difficulty = None  # Current difficulty: "EASY", "MEDIUM", "HARD", or "MULTIPLAY
 
 current_level_index = 0  # Current level (0-9, maps to LEVEL_DATA)
 
-level_time_target = LEVEL_DATA[0]  # Time to survive for current level
+level_time_ms = LEVEL_DATA_MS[0]  # Time to survive for current level (milliseconds)
 
-level_start_time = 0.0  # Timestamp when current level started
+level_start_ms = 0  # ticks_ms() when current level started
 
  
 
@@ -751,15 +1319,15 @@ splash_screen_shown = False  # One-time flag for startup splash animation
 
 # Claw state
 
-claw_y_offset = CLAW_RESET_Y  # Current Y offset of claw (negative = off-screen)
+claw_y_offset = CLAW_RESET_Y << CLAW_FRAC_BITS  # Current Y offset of claw, 8.8 fixed-point (negative = off-screen)
 
-claw_speed = INITIAL_CLAW_SPEED  # Current fall speed (increases per level)
+claw_speed = INITIAL_CLAW_SPEED  # Current fall speed, 8.8 fixed-point (increases per level)
 
 claw_has_hit = False  # Flag to prevent multiple hits from same claw pass
 
-last_hit_time = 0.0  # Timestamp of last hit (for cooldown)
+HIT_COOLDOWN_MS = const(500)  # Minimum milliseconds between hits
 
-HIT_COOLDOWN = 0.5  # Minimum seconds between hits
+last_hit_ms = ticks_add(ticks_ms(), -(HIT_COOLDOWN_MS + 1))  # ticks_ms() of last hit (for cooldown)
 
  
 
@@ -771,10 +1339,52 @@ HIT_COOLDOWN = 0.5  # Minimum seconds between hits
 
 # High scores are saved to flash memory and persist across power cycles
 
-HIGH_SCORE_FILE = "/high_scores.txt"  # File path in root filesystem
+HIGH_SCORE_FILE = "/high_scores.bin"  # File path in root filesystem
+
+HIGH_SCORE_LEGACY_FILE = "/high_scores.txt"  # Older text board ("ABC,42" per line), read once to carry it over
+
+HIGH_SCORE_RECORD = "<3sIx"  # One entry: 3 initials bytes, uint32 score (little-endian), pad byte
+
+HIGH_SCORE_RECORD_SIZE = const(8)  # struct.calcsize(HIGH_SCORE_RECORD)
+
+# The file is a rotating log of HIGH_SCORE_SLOTS slots. A save writes only the
+
+# next slot (a uint32 sequence number followed by the three records), so the
+
+# data's erases rotate over HIGH_SCORE_SLOTS blocks. The stride is one flash
+
+# erase block (the ESP32-C3's SPI flash erases 4 KB at a time): slots packed
+
+# closer would share a block, and every save would erase that same block again.
+
+# Nearly all of each stride is padding, so the slot count is kept small; four
+
+# slots cost a 16 KB file and already cut each data block's erases to a quarter.
+
+# Closing the file still rewrites its FAT directory entry, which stays in one
+
+# block, so that block wears as before; only the data writes are spread out.
+
+HIGH_SCORE_SLOTS = const(4)  # Number of slots in the log (16 KB file)
+
+HIGH_SCORE_SLOT_STRIDE = const(4096)  # Bytes from one slot to the next (one erase block)
+
+HIGH_SCORE_SLOT_SIZE = const(4 + 3 * HIGH_SCORE_RECORD_SIZE)  # Sequence number + board
+
+_score_buf = bytearray(HIGH_SCORE_SLOT_SIZE)  # Reused for reading/packing one slot
+
+_score_seq = 0  # Sequence number of the newest slot on flash (0 = none)
 
 high_scores = []  # List of tuples: (initials_string, score_int), sorted by score
 
+_last_saved_scores = None  # Snapshot of what is on flash (None = unknown, must write)
+
+FLASH_DEBOUNCE_MS = const(60000)  # How long a board change waits before it is written (milliseconds)
+
+_scores_dirty = False  # True when high_scores has changes not yet written to flash
+
+_scores_dirty_ms = 0  # ticks_ms() of the first change not yet written (valid while _scores_dirty)
+
  
 
 # Initial entry state (for entering 3-letter initials)
@@ -783,7 +1393,13 @@ entering_initials = False  # True when player is entering their initials
 
 initial_index = 0  # Which letter position (0=first, 1=second, 2=third)
 
-current_initials = ['A', 'A', 'A']  # Current letters being entered
+current_initials = [0, 0, 0]  # Letters being entered, as indexes into LETTERS (0 = 'A')
+
+LETTERS = tuple("ABCDEFGHIJKLMNOPQRSTUVWXYZ")  # Letters available for initials, indexed 0-25
+
+LETTER_CELLS = tuple(f" {c} " for c in LETTERS)  # Initial entry text for each letter
+
+LETTER_CURSORS = tuple(f"[{c}]" for c in LETTERS)  # Same, for the letter being edited
 
  
 
@@ -792,33 +1408,57 @@ def load_high_scores():
     """
     Load high scores from flash memory file
     
-    File format: Each line is "INITIALS,SCORE" (e.g., "ABC,42")
-    Loads up to 3 highest scores. If file doesn't exist, creates defaults.
+    File format: HIGH_SCORE_SLOTS slots, each a uint32 sequence number and three
+    fixed 8-byte HIGH_SCORE_RECORD entries; the slot with the highest sequence
+    number is the current board.
+    Loads up to 3 highest scores. If the file doesn't exist or no slot holds a
+    board yet, the board is carried over from HIGH_SCORE_LEGACY_FILE (the next
+    save writes it in the new format), or defaults are created.
     """
 
-    global high_scores
+    global high_scores, _last_saved_scores, _score_seq
 
     try:
 
-        with open(HIGH_SCORE_FILE, 'r') as f:
+        # Find the newest slot; empty slots have sequence number 0
 
-            high_scores = []
+        newest = None
 
-            for line in f:
+        with open(HIGH_SCORE_FILE, 'rb') as f:
+
+            for slot in range(HIGH_SCORE_SLOTS):
+
+                f.seek(slot * HIGH_SCORE_SLOT_STRIDE)
+
+                if f.readinto(_score_buf) != HIGH_SCORE_SLOT_SIZE:
 
-                line = line.strip()
+                    break
 
-                if line:
+                seq = struct.unpack_from("<I", _score_buf, 0)[0]
 
-                    parts = line.split(',')
+                if seq > _score_seq:
 
-                    if len(parts) == 2:
+                    _score_seq = seq
 
-                        initials = parts[0]
+                    newest = bytes(_score_buf)
 
-                        score_val = int(parts[1])
+        if newest is None:
 
-                        high_scores.append((initials, score_val))
+            # Every slot is empty: nothing has been saved in this format yet
+
+            high_scores = load_legacy_high_scores()
+
+            return
+
+        high_scores = []
+
+        for offset in range(4, HIGH_SCORE_SLOT_SIZE, HIGH_SCORE_RECORD_SIZE):
+
+            initials, score_val = struct.unpack_from(HIGH_SCORE_RECORD, newest, offset)
+
+            if initials[0]:  # Unused entries are zero-filled
+
+                high_scores.append((initials.decode(), score_val))
 
         # Sort by score descending (highest first)
 
@@ -828,119 +1468,282 @@ def load_high_scores():
 
         high_scores = high_scores[:3]
 
+        _last_saved_scores = tuple(high_scores)
+
     except:
 
-        # File doesn't exist or error reading, start with defaults
+        # File doesn't exist or error reading: fall back to the old text board
 
-        high_scores = [("AAA", 0), ("AAA", 0), ("AAA", 0)]
+        high_scores = load_legacy_high_scores()
 
  
 
-def save_high_scores():
+def load_legacy_high_scores():
 
     """
-    Save high scores to flash memory
+    Read the board an older version saved as text, one "INITIALS,SCORE" per line
     
-    Temporarily remounts filesystem as writable, saves data, then remounts as read-only
+    Returns:
+        Up to 3 (initials, score) tuples, highest first; defaults if there is no
+        old file or it can't be read
     """
 
     try:
 
-        # Remount filesystem as writable (default is read-only)
+        scores = []
 
-        storage.remount("/", False)
+        with open(HIGH_SCORE_LEGACY_FILE, 'r') as f:
 
-        with open(HIGH_SCORE_FILE, 'w') as f:
+            for line in f:
 
-            for initials, score_val in high_scores:
+                parts = line.strip().split(',')
 
-                f.write(f"{initials},{score_val}\n")
+                if len(parts) == 2:
 
-        # Remount as read-only
+                    scores.append((parts[0], int(parts[1])))
 
-        storage.remount("/", True)
+        scores.sort(key=lambda x: x[1], reverse=True)
 
-    except Exception as e:
+        if scores:
 
-        print("Error saving high scores:", e)
+            return scores[:3]
+
+    except:
+
+        pass
+
+    return [("AAA", 0), ("AAA", 0), ("AAA", 0)]
 
  
 
-def is_high_score(score_val):
+class _WritableFilesystem:
 
     """
-    Check if a score qualifies for the high score board
-    
-    Args:
-        score_val: Score to check
+    Context manager that remounts the flash filesystem writable while in use
     
-    Returns:
-        True if score beats one of top 3 scores or fewer than 3 scores exist
+    Read-write on enter, back to read-only on exit (also when the write fails).
     """
 
-    if len(high_scores) < 3:
+    def __enter__(self):
+
+        storage.remount("/", False)
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+
+        storage.remount("/", True)
+
+        return False
 
-        return True  # Always accept if board isn't full
 
-    return score_val > high_scores[-1][1]  # Beat the lowest high score
+
+_writable_fs = _WritableFilesystem()
 
  
 
-def add_high_score(initials, score_val):
+def save_high_scores():
 
     """
-    Add a new high score to the board and save to flash
+    Save high scores to flash memory
     
-    Args:
-        initials: 3-letter string of player initials
-        score_val: Score achieved
+    Temporarily remounts filesystem as writable, saves data, then remounts as read-only
     """
 
-    global high_scores
+    global _last_saved_scores, _score_seq
 
-    high_scores.append((initials, score_val))
+    # Nothing to do if flash already holds exactly this board
 
-    high_scores.sort(key=lambda x: x[1], reverse=True)  # Sort highest first
+    if tuple(high_scores) == _last_saved_scores:
 
-    high_scores = high_scores[:3]
+        return
 
-    save_high_scores()
+    try:
 
- 
+        # Filesystem is writable only inside this block (default is read-only)
 
-# Load high scores at startup
+        with _writable_fs:
 
-load_high_scores()
+            # Pack the board into the next slot after the newest one
 
- 
+            seq = _score_seq + 1
 
-# --------------------
+            _score_buf[:] = bytes(HIGH_SCORE_SLOT_SIZE)
 
-# Health LEDs
+            struct.pack_into("<I", _score_buf, 0, seq)
 
-# --------------------
+            for i, (initials, score_val) in enumerate(high_scores[:3]):
 
-def update_health_bar():
+                struct.pack_into(HIGH_SCORE_RECORD, _score_buf, 4 + i * HIGH_SCORE_RECORD_SIZE,
+                                 initials.encode(), score_val)
 
-    for i in range(NUM_LEDS):
+            try:
 
-        if i < lives:
+                f = open(HIGH_SCORE_FILE, 'r+b')
 
-            pixels[i] = (0, 255, 0)
+                if f.seek(0, 2) != HIGH_SCORE_SLOTS * HIGH_SCORE_SLOT_STRIDE:
 
-        else:
+                    f.close()
 
-            pixels[i] = (0, 0, 255)
+                    raise OSError("wrong size")
 
- 
+            except OSError:
 
-def clear_health_bar():
+                # Missing (or old format): create the log with every slot empty
 
-    for i in range(NUM_LEDS):
+                f = open(HIGH_SCORE_FILE, 'wb')
 
-        pixels[i] = (255, 0, 0)
+                f.write(bytes(HIGH_SCORE_SLOTS * HIGH_SCORE_SLOT_STRIDE))
 
- 
+            with f:
+
+                f.seek((seq % HIGH_SCORE_SLOTS) * HIGH_SCORE_SLOT_STRIDE)
+
+                f.write(_score_buf)
+
+        _score_seq = seq
+
+        _last_saved_scores = tuple(high_scores)
+
+    except Exception as e:
+
+        print("Error saving high scores:", e)
+
+ 
+
+def flush_high_scores():
+
+    """
+    Write pending high score changes to flash once the first of them is
+    FLASH_DEBOUNCE_MS old
+    
+    Called from the idle screens (menu and high score board), so every change
+    made in the meantime goes out in one write. A board changed less than
+    FLASH_DEBOUNCE_MS before power is cut is lost.
+    """
+
+    global _scores_dirty
+
+    if not _scores_dirty or ticks_diff(ticks_ms(), _scores_dirty_ms) < FLASH_DEBOUNCE_MS:
+
+        return
+
+    save_high_scores()
+
+    _scores_dirty = False
+
+ 
+
+def is_high_score(score_val):
+
+    """
+    Check if a score qualifies for the high score board
+    
+    Args:
+        score_val: Score to check
+    
+    Returns:
+        True if score beats one of top 3 scores or fewer than 3 scores exist
+    """
+
+    if len(high_scores) < 3:
+
+        return True  # Always accept if board isn't full
+
+    return score_val > high_scores[-1][1]  # Beat the lowest high score
+
+ 
+
+def add_high_score(initials, score_val):
+
+    """
+    Add a new high score to the board and schedule it to be saved to flash
+    
+    Args:
+        initials: 3-letter string of player initials
+        score_val: Score achieved
+    """
+
+    global _scores_dirty, _scores_dirty_ms
+
+    # Insert after every score at least as high (list stays sorted highest first)
+
+    pos = 0
+
+    while pos < len(high_scores) and high_scores[pos][1] >= score_val:
+
+        pos += 1
+
+    high_scores.insert(pos, (initials, score_val))
+
+    del high_scores[3:]
+
+    # The debounce window starts at the first change since the last write
+
+    if not _scores_dirty:
+
+        _scores_dirty_ms = ticks_ms()
+
+    _scores_dirty = True  # Written by flush_high_scores() from an idle screen
+
+ 
+
+# Load high scores at startup
+
+load_high_scores()
+
+ 
+
+# --------------------
+
+# Health LEDs
+
+# --------------------
+
+# Lives count currently shown on the LEDs (-1 = cleared/red), so an
+
+# unchanged bar never triggers another NeoPixel write
+
+_last_health = None
+
+# Whole-strip colours for 0..NUM_LEDS lit LEDs (green = life left, blue = life lost),
+
+# so an update is a single slice assignment
+
+HEALTH_FRAMES = tuple(((0, 255, 0),) * lit + ((0, 0, 255),) * (NUM_LEDS - lit)
+                      for lit in range(NUM_LEDS + 1))
+
+def update_health_bar():
+
+    global _last_health
+
+    if lives == _last_health:
+
+        return
+
+    pixels[:] = HEALTH_FRAMES[lives if lives < NUM_LEDS else NUM_LEDS]
+
+    pixels.show()
+
+    _last_health = lives
+
+ 
+
+def clear_health_bar():
+
+    global _last_health
+
+    if _last_health == -1:
+
+        return
+
+    pixels.fill((255, 0, 0))
+
+    pixels.show()
+
+    _last_health = -1
+
+ 
 
 # --------------------
 
@@ -948,11 +1751,21 @@ def clear_health_bar():
 
 # --------------------
 
+# Claw spawn range for random respawns. random.randint() is native code in
+
+# CircuitPython, so it stays; only its bounds are folded into constants
+
+CLAW_SPAWN_X_MIN = const(-10)
+
+CLAW_SPAWN_X_MAX = const(SCREEN_WIDTH - CLAW_WIDTH + 10)
+
+ 
+
 def reset_claw_spawn(random_x=True):
 
     global claw_y_offset, claw_has_hit
 
-    claw_y_offset = CLAW_RESET_Y
+    claw_y_offset = CLAW_RESET_Y << CLAW_FRAC_BITS
 
     claw_has_hit = False
 
@@ -962,29 +1775,25 @@ def reset_claw_spawn(random_x=True):
 
         # Allow claw to spawn from -10 to screen width, so grabbers can reach edges
 
-        x = random.randint(-10, SCREEN_WIDTH - CLAW_WIDTH + 10)
+        x = random.randint(CLAW_SPAWN_X_MIN, CLAW_SPAWN_X_MAX)
 
     else:
 
         x = (SCREEN_WIDTH - CLAW_WIDTH) // 2
 
-    claw_line1.x = x
-
-    claw_line2.x = x
-
-    claw_line3.x = x
+    set_claw_x(x)
 
  
 
 def start_easy():
 
-    global difficulty, current_level_index, level_start_time, game_state, lives, claw_speed, score
+    global difficulty, current_level_index, level_start_ms, game_state, lives, claw_speed, score
 
     difficulty = "EASY"
 
     current_level_index = 0
 
-    level_start_time = time.monotonic()
+    level_start_ms = ticks_ms()
 
     game_state = "PLAYING"
 
@@ -1006,13 +1815,13 @@ def start_easy():
 
 def start_medium():
 
-    global difficulty, current_level_index, level_start_time, game_state, lives, claw_speed, score
+    global difficulty, current_level_index, level_start_ms, game_state, lives, claw_speed, score
 
     difficulty = "MEDIUM"
 
     current_level_index = 0
 
-    level_start_time = time.monotonic()
+    level_start_ms = ticks_ms()
 
     game_state = "PLAYING"
 
@@ -1024,7 +1833,7 @@ def start_medium():
 
     reset_claw_spawn()
 
-    claw_speed = INITIAL_CLAW_SPEED + 0.4
+    claw_speed = INITIAL_CLAW_SPEED + MEDIUM_SPEED_BONUS
 
     deinit_multiplayer_uart()
 
@@ -1034,13 +1843,13 @@ def start_medium():
 
 def start_hard():
 
-    global difficulty, current_level_index, level_start_time, game_state, lives, claw_speed, score
+    global difficulty, current_level_index, level_start_ms, game_state, lives, claw_speed, score
 
     difficulty = "HARD"
 
     current_level_index = 0
 
-    level_start_time = time.monotonic()
+    level_start_ms = ticks_ms()
 
     game_state = "PLAYING"
 
@@ -1052,7 +1861,7 @@ def start_hard():
 
     reset_claw_spawn()
 
-    claw_speed = INITIAL_CLAW_SPEED + 0.8
+    claw_speed = INITIAL_CLAW_SPEED + HARD_SPEED_BONUS
 
     deinit_multiplayer_uart()
 
@@ -1062,17 +1871,17 @@ def start_hard():
 
 def start_multiplayer():
 
-    global difficulty, current_level_index, level_start_time, game_state, lives
+    global difficulty, current_level_index, level_start_ms, game_state, lives
 
-    global claw_y_offset, score
+    global claw_y_offset, score, drop_phase
 
     difficulty = "MULTIPLAYER"
 
     current_level_index = 0
 
-    level_time_target = 120.0  # 120 second rounds (2 minutes)
+    level_time_ms = 120000  # 120 second rounds (2 minutes)
 
-    level_start_time = time.monotonic()
+    level_start_ms = ticks_ms()
 
     game_state = "PLAYING"
 
@@ -1082,19 +1891,17 @@ def start_multiplayer():
 
     title_label.text = "MULTI"
 
-    claw_y_offset = CLAW_RESET_Y
+    claw_y_offset = CLAW_RESET_Y << CLAW_FRAC_BITS
+
+    set_claw_y(CLAW_RESET_Y)
 
-    set_claw_y(int(claw_y_offset))
+    drop_phase = DROP_IDLE
 
     # Center claw initially
 
     x = (SCREEN_WIDTH - CLAW_WIDTH) // 2
 
-    claw_line1.x = x
-
-    claw_line2.x = x
-
-    claw_line3.x = x
+    set_claw_x(x)
 
     init_multiplayer_uart()
 
@@ -1104,9 +1911,9 @@ def start_multiplayer():
 
 def start_level_same_difficulty():
 
-    global level_start_time, claw_speed, current_level_index
+    global level_start_ms, claw_speed, current_level_index
 
-    level_start_time = time.monotonic()
+    level_start_ms = ticks_ms()
 
     if difficulty != "MULTIPLAYER":
 
@@ -1122,6 +1929,59 @@ def start_level_same_difficulty():
 
 # --------------------
 
+def splash_frames(game_title, splash_claw):
+
+    """
+    Generate the splash animation one frame at a time
+    
+    Each step updates the splash labels and yields how long (milliseconds) the
+    frame should stay on screen, so the caller decides how to wait.
+    
+    Args:
+        game_title: Title label to flash
+        splash_claw: Claw label to drop and raise
+    """
+
+    # Animate claw dropping all the way to the bottom
+
+    for y in range(0, SCREEN_HEIGHT, 2):
+
+        splash_claw.y = y
+
+        yield 25
+
+    
+
+    # Quick rise back up off screen
+
+    for y in range(SCREEN_HEIGHT, -15, -4):
+
+        splash_claw.y = y
+
+        yield 15
+
+    
+
+    # Flash the title
+
+    for _ in range(3):
+
+        game_title.color = 0x00FF00
+
+        yield 150
+
+        game_title.color = 0xFFFF00
+
+        yield 150
+
+    
+
+    # Hold the final frame
+
+    yield 500
+
+
+
 def animated_splash_screen():
 
     """Show animated splash screen with falling claw animation"""
@@ -1170,836 +2030,1111 @@ def animated_splash_screen():
 
     splash_claw.anchored_position = (SCREEN_WIDTH // 2, 0)
 
-    splash.append(splash_claw)
+    splash.append(splash_claw)
+
+    
+
+    # Step through the animation one frame at a time, keeping the tone
+
+    # scheduler running while each frame is held on screen. Each deadline
+
+    # follows on from the previous one, so refresh time doesn't pile up
+
+    frame_end = ticks_ms()
+
+    for hold in splash_frames(game_title, splash_claw):
+
+        display.refresh(target_frames_per_second=None)
+
+        frame_end = ticks_add(frame_end, hold)
+
+        while True:
+
+            now = ticks_ms()
+
+            update_tones(now)
+
+            wait = ticks_diff(frame_end, now)
+
+            if wait <= 0:
+
+                break
+
+            # Sleep straight through to the next tone change or the frame end,
+
+            # whichever is first, instead of polling
+
+            if _tone_queue:
+
+                wait = min(wait, ticks_diff(_tone_queue[0][1], now))
+
+            time.sleep(wait / 1000)
+
+    
+
+    # Remove splash elements
+
+    splash.remove(game_title)
+
+    splash.remove(subtitle)
+
+    splash.remove(splash_claw)
+
+
+
+# --------------------
+
+# Calibration
+
+# --------------------
+
+def calibrate_accelerometer():
+
+    """Show accelerometer values for calibration"""
+
+    title_label.text = "CALIBRATE"
+
+    message_label.text = "Tilt to test"
+
+    
+
+    calib_start = ticks_ms()
+
+    calib_duration = 5000  # Show calibration for 5 seconds (milliseconds)
+
+    
+
+    # Create temporary label for showing accel values
+
+    accel_label = label.Label(terminalio.FONT, text="", color=0xFFFFFF)
+
+    accel_label.anchor_point = (0.5, 0.5)
+
+    accel_label.anchored_position = (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 15)
+
+    splash.append(accel_label)
+
+    
+
+    min_x, max_x = 0.0, 0.0
+
+    
+
+    while ticks_diff(ticks_ms(), calib_start) < calib_duration:
+
+        try:
+
+            ax = read_tilt_x() * ADXL345_MS2_PER_COUNT  # Same single-burst read as the game loop
+
+            if ax < min_x:
+
+                min_x = ax
+
+            if ax > max_x:
+
+                max_x = ax
+
+            accel_label.text = f"X:{ax:.1f}\nMin:{min_x:.1f} Max:{max_x:.1f}"
+
+        except:
+
+            accel_label.text = "Error reading"
+
+
+
+        display.refresh(target_frames_per_second=None)
+
+        update_tones(ticks_ms())
+
+        # Poll faster while a tune is queued so note lengths stay accurate
+
+        time.sleep(0.01 if _tone_queue else 0.1)
+
+    
+
+    # Remove calibration label
+
+    splash.remove(accel_label)
+
+    message_label.text = ""
+
+    display.refresh(target_frames_per_second=None)
+
+
+
+# Queue the startup sound so it plays over the splash animation
+
+startup_sound()
+
+ 
+
+# Show animated splash screen on first boot
+
+animated_splash_screen()
+
+
+
+# Run calibration at startup
+
+calibrate_accelerometer()
+
+
+
+# --------------------
+
+# Menu
+
+# --------------------
+
+def set_game_view_hidden(hidden):
+
+    """
+    Switch between the game screen and the high score screen
+    
+    Every label stays in the group; only .hidden flips, so displayio just
+    redraws the areas that appear or disappear.
+    
+    Args:
+        hidden: True to hide the HUD, claw and player and show the high score labels
+    """
+
+    title_label.hidden = hud_grid.hidden = hidden
+
+    claw_sprite.hidden = player_label.hidden = hidden
+
+    shown = not hidden
+
+    hs_title_label.hidden = hs_line1_label.hidden = hs_line2_label.hidden = shown
+
+    hs_line3_label.hidden = hs_prompt_label.hidden = shown
+
+
+
+def show_menu():
+
+    global in_menu, rot_last_position
+
+    in_menu = True
+
+    rot_last_position = encoder.position  # Ignore turns made during the game
+
+    clear_health_bar()
+
+    title_label.text = "MENU"
+
+    message_label.text = f"< {DIFFICULTY_OPTIONS[menu_index]} >"
+
+    reset_claw_spawn(random_x=False)
+
+    set_claw_y(CLAW_RESET_Y)
+
+    # Hide claw completely off-screen in menu
+
+    claw_sprite.y = -100
+
+    # Bring the game screen back and hide the high score display. The HUD strip
+
+    # still holds the last game's values, so it stays hidden until a game starts
+
+    set_game_view_hidden(False)
+
+    hud_grid.hidden = True
+
+    deinit_multiplayer_uart()
+
+ 
+
+def show_high_scores():
+
+    """Display the high score board"""
+
+    # Hide game elements (HUD, claw and player) and reveal the high score labels
+
+    set_game_view_hidden(True)
+
+    message_label.text = ""
+
+    
+
+    # Show high scores (blank any line without a score)
+
+    hs_title_label.text = "HIGH SCORES"
+
+    hs_line1_label.text = f"1. {high_scores[0][0]} - {high_scores[0][1]}" if len(high_scores) > 0 else ""
+
+    hs_line2_label.text = f"2. {high_scores[1][0]} - {high_scores[1][1]}" if len(high_scores) > 1 else ""
+
+    hs_line3_label.text = f"3. {high_scores[2][0]} - {high_scores[2][1]}" if len(high_scores) > 2 else ""
+
+    
+
+    hs_prompt_label.text = "Press to continue"
+
+ 
+
+def show_initial_entry():
+
+    """Display initial entry screen"""
+
+    global entering_initials, initial_index, current_initials, rot_last_position
+
+    entering_initials = True
+
+    rot_last_position = encoder.position  # Ignore turns made during the game
+
+    initial_index = 0
+
+    current_initials = [0, 0, 0]
 
     
 
-    # Animate claw dropping all the way to the bottom
+    # Hide game elements (HUD, claw and player) and reveal the high score labels
 
-    for y in range(0, SCREEN_HEIGHT, 2):
+    set_game_view_hidden(True)
 
-        splash_claw.y = y
+    message_label.text = ""
 
-        time.sleep(0.025)
 
-    
 
-    # Quick rise back up off screen
+    hs_title_label.text = "NEW HIGH SCORE!"
 
-    for y in range(SCREEN_HEIGHT, -15, -4):
+    hs_line1_label.text = ""
 
-        splash_claw.y = y
+    hs_line3_label.text = ""
 
-        time.sleep(0.015)
+    hs_prompt_label.text = "Rotate:Change Press:Next"
 
-    
+    update_initial_display()
 
-    # Flash the title
+ 
 
-    for _ in range(3):
+def update_initial_display():
 
-        game_title.color = 0x00FF00
+    """Update the display showing current initials being entered"""
 
-        time.sleep(0.15)
+    # Show initials with cursor (the other lines are set once by show_initial_entry)
 
-        game_title.color = 0xFFFF00
+    parts = [LETTER_CELLS[i] for i in current_initials]
 
-        time.sleep(0.15)
+    parts[initial_index] = LETTER_CURSORS[current_initials[initial_index]]
 
-    
+    hs_line2_label.text = "".join(parts)
 
-    time.sleep(0.5)
+ 
 
-    
+show_menu()
 
-    # Remove splash elements
+ 
 
-    splash.remove(game_title)
+# --------------------
 
-    splash.remove(subtitle)
+# Collision
 
-    splash.remove(splash_claw)
+# --------------------
 
+# The claw text is "  |  |" - the | symbols are at character positions 2 and 5
+# (6 pixels per character, each | drawn 2 pixels wide starting 2 pixels in).
+# Touching either grabber (with a 3 pixel player radius) or standing between
+# them is one continuous span of the player's center, relative to the claw's x:
+CLAW_HIT_LEFT = const(2 * 6 + 2 - 3)  # Left grabber's left edge minus player radius
+CLAW_HIT_RIGHT = const(5 * 6 + 2 + 2 + 3)  # Right grabber's right edge plus player radius
+# Claw sprite y range where the grabbers are at or just past the player level
+CLAW_HIT_Y_MIN = PLAYER_Y - 2 - CLAW_GRABBER_Y
+CLAW_HIT_Y_MAX = PLAYER_Y + 4 - CLAW_GRABBER_Y
+PLAYER_HALF = const(PLAYER_WIDTH // 2)  # Player center, relative to player_x
+
+def check_collision():
+    """Check collision with the claw grabbers - hits if touching either | or caught between them"""
+    # Only the bottom claw line (grabbers) can hit you, and only when it is
+    # at or just past the player level - the cheapest, most selective test first
+    if not CLAW_HIT_Y_MIN <= claw_sprite.y <= CLAW_HIT_Y_MAX:
+        return False
+    offset = player_x + PLAYER_HALF - claw_sprite.x
+    return CLAW_HIT_LEFT <= offset <= CLAW_HIT_RIGHT
 
+ 
 
 # --------------------
 
-# Calibration
+# Multiplayer claw drop
 
 # --------------------
 
-def calibrate_accelerometer():
+# The drop is a small state machine advanced one step per due frame by the
 
-    """Show accelerometer values for calibration"""
+# main loop, so UART, input and sound keep running while the claw moves. Each
 
-    title_label.text = "CALIBRATE"
+# deadline is counted from the previous one rather than from the (possibly
 
-    message_label.text = "Tilt to test"
+# late) frame that handled it, so slow frames don't stretch the animation: a
 
-    
+# late step is followed immediately by the next, one step (and collision
 
-    calib_start = time.monotonic()
+# check) per frame, until the drop is back on schedule
 
-    calib_duration = 5.0  # Show calibration for 5 seconds
+DROP_IDLE = const(0)  # No drop in progress (fire commands accepted)
 
-    
+DROP_FALLING = const(1)  # Moving down, checking for hits
 
-    # Create temporary label for showing accel values
+DROP_RISING = const(2)  # Moving back up (no collision checking)
 
-    accel_label = label.Label(terminalio.FONT, text="", color=0xFFFFFF)
+DROP_REARM = const(3)  # Back at the top, waiting out DROP_REARM_MS
 
-    accel_label.anchor_point = (0.5, 0.5)
+drop_phase = DROP_IDLE  # Current phase of the drop
 
-    accel_label.anchored_position = (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 15)
+drop_step = 0  # Current step of the fall/rise (0..DROP_STEPS)
 
-    splash.append(accel_label)
+drop_next_ms = 0  # ticks_ms() when the next step is due
 
-    
+drop_hit = False  # True once this drop has cost a life
 
-    min_x, max_x = 0.0, 0.0
+ 
 
-    
+def start_claw_drop(now):
 
-    while time.monotonic() - calib_start < calib_duration:
+    """
+    Start a multiplayer claw drop; the first step happens on the next update
+    
+    Args:
+        now: Current ticks_ms() value
+    """
 
-        try:
+    global drop_phase, drop_step, drop_next_ms, drop_hit
 
-            ax, ay, az = accelerometer.acceleration
+    if game_state != "PLAYING":
 
-            if ax < min_x:
+        return
 
-                min_x = ax
+    drop_phase = DROP_FALLING
 
-            if ax > max_x:
+    drop_step = 0
 
-                max_x = ax
+    drop_next_ms = now
 
-            accel_label.text = f"X:{ax:.1f}\nMin:{min_x:.1f} Max:{max_x:.1f}"
+    drop_hit = False
 
-        except:
+ 
 
-            accel_label.text = "Error reading"
+def update_claw_drop(now):
 
-        
+    """
+    Advance the multiplayer claw drop if its next step is due
+    
+    Args:
+        now: Current ticks_ms() value
+    """
 
-        time.sleep(0.1)
+    global drop_phase, drop_step, drop_next_ms, drop_hit
 
-    
+    global lives, game_state, claw_y_offset, last_hit_ms
 
-    # Remove calibration label
+    if drop_phase == DROP_IDLE or ticks_diff(now, drop_next_ms) < 0:
 
-    splash.remove(accel_label)
+        return
 
-    message_label.text = ""
+    if drop_phase == DROP_FALLING:
 
+        offset = drop_step * DROP_STEP_PIXELS
 
+        claw_y_offset = offset << CLAW_FRAC_BITS
 
-# Show animated splash screen on first boot
+        set_claw_y(offset)
 
-animated_splash_screen()
+        # Check collision during drop (with cooldown). A drop that outlives the
 
+        # game only finishes its animation, it can't hit any more
 
+        if (game_state == "PLAYING" and not drop_hit and check_collision()
 
-# Play startup sound
+                and ticks_diff(now, last_hit_ms) > HIT_COOLDOWN_MS):
 
-startup_sound()
+            lives -= 1
 
+            update_health_bar()
 
+            drop_hit = True
 
-# Run calibration at startup
+            last_hit_ms = now
 
-calibrate_accelerometer()
+            if lives <= 0:
 
+                game_state = "GAME_OVER"
 
+                message_label.text = f"GAME OVER\nScore: {score}"
 
-# --------------------
+                game_over_sound()
 
-# Menu
+        if drop_step < DROP_STEPS:
 
-# --------------------
+            drop_step += 1
 
-def show_menu():
+            drop_next_ms = ticks_add(drop_next_ms, DROP_STEP_MS)
 
-    global in_menu
+        else:
 
-    in_menu = True
+            # Reached the bottom: hold, then rise back up
 
-    clear_health_bar()
+            drop_phase = DROP_RISING
 
-    title_label.text = "MENU"
+            drop_next_ms = ticks_add(drop_next_ms, DROP_STEP_MS + DROP_HOLD_MS)
 
-    message_label.text = f"< {DIFFICULTY_OPTIONS[menu_index]} >"
+    elif drop_phase == DROP_RISING:
 
-    reset_claw_spawn(random_x=False)
+        offset = drop_step * DROP_STEP_PIXELS
 
-    set_claw_y(CLAW_RESET_Y)
+        claw_y_offset = offset << CLAW_FRAC_BITS
 
-    # Hide claw completely off-screen in menu
+        set_claw_y(offset)
 
-    claw_line1.y = -100
+        if drop_step > 0:
 
-    claw_line2.y = -100
+            drop_step -= 1
 
-    claw_line3.y = -100
+            drop_next_ms = ticks_add(drop_next_ms, DROP_STEP_MS)
 
-    # Clear high score display
+        else:
 
-    hs_title_label.text = ""
+            # Small delay to prevent immediate re-triggering
 
-    hs_line1_label.text = ""
+            claw_y_offset = CLAW_RESET_Y << CLAW_FRAC_BITS
 
-    hs_line2_label.text = ""
+            drop_phase = DROP_REARM
 
-    hs_line3_label.text = ""
+            drop_next_ms = ticks_add(drop_next_ms, DROP_STEP_MS + DROP_REARM_MS)
 
-    hs_prompt_label.text = ""
+    else:
 
-    deinit_multiplayer_uart()
+        drop_phase = DROP_IDLE
 
  
 
-def show_high_scores():
+# --------------------
 
-    """Display the high score board"""
+# Frame rendering
 
-    # Hide game elements
+# --------------------
 
-    title_label.text = ""
+# HUD values last drawn into the HUD strip; a field is only redrawn when its value
 
-    level_label.text = ""
+# changes (-1 forces a redraw)
 
-    timer_label.text = ""
+LIVES_STR = ("L0", "L1", "L2", "L3")  # Lives text, indexed by lives remaining
 
-    lives_label.text = ""
+LEVEL_STR = tuple(f"Lv{i + 1}" for i in range(len(LEVEL_DATA)))  # Level text, shown as 1-10
 
-    score_label.text = ""
+_last_level = -1
 
-    message_label.text = ""
+_last_lives = -1
 
-    
+_last_seconds = -1
 
-    # Hide claw
+_last_score = -1
 
-    claw_line1.y = -100
 
-    claw_line2.y = -100
 
-    claw_line3.y = -100
+def update_hud(remaining):
 
+    """
+    Push this frame's HUD values and player position to the screen
     
+    Args:
+        remaining: Milliseconds left on the current level
+    """
 
-    # Show high scores
-
-    hs_title_label.text = "HIGH SCORES"
+    global _last_level, _last_lives, _last_seconds, _last_score, _frame_dirty
 
-    if len(high_scores) > 0:
+    if current_level_index != _last_level:
 
-        hs_line1_label.text = f"1. {high_scores[0][0]} - {high_scores[0][1]}"
+        draw_hud_field(LEVEL_STR[current_level_index], 0, HUD_LEFT)
 
-    if len(high_scores) > 1:
+        _last_level = current_level_index
 
-        hs_line2_label.text = f"2. {high_scores[1][0]} - {high_scores[1][1]}"
+        _frame_dirty = True
 
-    if len(high_scores) > 2:
+    if lives != _last_lives:
 
-        hs_line3_label.text = f"3. {high_scores[2][0]} - {high_scores[2][1]}"
+        draw_hud_field(LIVES_STR[lives], 0, HUD_RIGHT)
 
-    
+        _last_lives = lives
 
-    hs_prompt_label.text = "Press to continue"
+        _frame_dirty = True
 
- 
+    seconds = remaining // 1000
 
-def show_initial_entry():
+    if seconds != _last_seconds:
 
-    """Display initial entry screen"""
+        draw_hud_field(f"T:{seconds}s", 1, HUD_LEFT)
 
-    global entering_initials, initial_index, current_initials
+        _last_seconds = seconds
 
-    entering_initials = True
+        _frame_dirty = True
 
-    initial_index = 0
+    if score != _last_score:
 
-    current_initials = ['A', 'A', 'A']
+        draw_hud_field(f"S:{score}", 1, HUD_RIGHT)
 
-    
+        _last_score = score
 
-    # Hide game elements
+        _frame_dirty = True
 
-    title_label.text = ""
+    x = int(player_x)
 
-    level_label.text = ""
+    if player_label.x != x:
 
-    timer_label.text = ""
+        player_label.x = x
 
-    lives_label.text = ""
+        _frame_dirty = True
 
-    score_label.text = ""
+ 
 
-    message_label.text = ""
+def draw_frame():
 
-    
+    """Refresh the display once, if anything on it changed this frame"""
 
-    # Hide claw
+    global _frame_dirty
 
-    claw_line1.y = -100
+    # Nothing moved or changed: skip the refresh and leave the I2C bus idle.
 
-    claw_line2.y = -100
+    # The loop does its own pacing; with a target frame rate refresh() would
 
-    claw_line3.y = -100
+    # silently drop any call made more than one target frame after the last
 
-    
+    if _frame_dirty:
 
-    hs_title_label.text = "NEW HIGH SCORE!"
+        display.refresh(target_frames_per_second=None)
 
-    update_initial_display()
+        _frame_dirty = False
 
  
 
-def update_initial_display():
+# ==============================================================================
 
-    """Update the display showing current initials being entered"""
+# MAIN GAME LOOP
 
-    # Show initials with cursor
+# ==============================================================================
 
-    initial_str = ""
+# This loop runs continuously and handles:
 
-    for i in range(3):
+# - Input from rotary encoder (rotation and button press)
 
-        if i == initial_index:
+# - Menu navigation and difficulty selection
 
-            initial_str += f"[{current_initials[i]}]"
+# - Player movement via accelerometer
 
-        else:
+# - Claw movement and collision detection  
 
-            initial_str += f" {current_initials[i]} "
+# - Score tracking and level progression
 
-    
+# - High score entry and display
 
-    hs_line1_label.text = ""
+# - UART communication for multiplayer mode
 
-    hs_line2_label.text = initial_str
+def run_game_loop(ticks_ms=ticks_ms, ticks_diff=ticks_diff, sleep=time.sleep, display=display,
+                  rot_btn=rot_btn, encoder=encoder,
+                  read_tilt_x=read_tilt_x, update_tones=update_tones, tone_queue=_tone_queue,
+                  check_collision=check_collision, set_claw_x=set_claw_x, set_claw_y=set_claw_y,
+                  update_hud=update_hud, draw_frame=draw_frame, claw_sprite=claw_sprite,
+                  process_uart=process_uart, send_player_position=send_player_position,
+                  start_claw_drop=start_claw_drop, update_claw_drop=update_claw_drop,
+                  tilt_min=TILT_RAW_MIN, tilt_max=TILT_RAW_MAX, tilt_step_lut=TILT_STEP_LUT,
+                  aim_min=ACCEL_MIN, aim_max=ACCEL_MAX, aim_scale=AIM_SCALE, aim_offset=AIM_OFFSET):
 
-    hs_line3_label.text = ""
+    """
+    Run the game forever
+    
+    Objects, functions and float tuning values used every frame are bound as
+    default arguments, so the loop reads them as fast locals instead of module
+    globals. (const() integers are already folded in by the compiler.)
+    """
 
-    hs_prompt_label.text = "Rotate:Change Press:Next"
+    global in_menu, menu_index, rot_last_position, last_btn_state, last_btn_press_ms
 
- 
+    global game_state, lives, score, player_x, current_level_index, level_time_ms
 
-show_menu()
+    global claw_y_offset, claw_has_hit, last_hit_ms, fire_flag, drop_phase
 
- 
+    global entering_initials, initial_index, _frame_dirty
 
-# --------------------
+    tilt_countdown = 0  # Frames until the next accelerometer read
 
-# Collision
+    move_step = 0  # Player movement per frame from the last tilt reading
 
-# --------------------
+    remaining = level_time_ms  # Time left, held while the post-game screens show
 
-def check_collision():
-    """Check collision with the claw grabbers - hits if touching either | or caught between them"""
-    # The claw text is "  |  |" - the | symbols are at character positions 2 and 5
-    claw_base_x = claw_line3.x  # Use line3's x position directly
-    
-    # Calculate pixel positions of the two grabber lines (| symbols)
-    # Each character is 6 pixels wide in terminalio.FONT
-    left_grabber_x = claw_base_x + (2 * 6) + 2  # Left edge of first | symbol
-    right_grabber_x = claw_base_x + (5 * 6) + 2  # Left edge of second | symbol
-    grabber_width = 2  # The | symbol is only 2 pixels wide
-    
-    player_center = player_x + PLAYER_WIDTH // 2
-    player_radius = 3  # Player hitbox radius
- 
-    # Only the bottom claw line (line3) can hit you
-    claw_bottom = claw_line3.y
- 
-    # Only trigger when the bottom part is at or past the player level
-    if claw_bottom >= PLAYER_Y - 2 and claw_bottom <= PLAYER_Y + 4:
-        # Check if player hits left grabber
-        left_hit = (player_center >= left_grabber_x - player_radius and 
-                   player_center <= left_grabber_x + grabber_width + player_radius)
-        # Check if player hits right grabber
-        right_hit = (player_center >= right_grabber_x - player_radius and 
-                    player_center <= right_grabber_x + grabber_width + player_radius)
-        # Check if player is caught BETWEEN the grabbers
-        caught_between = (player_center > left_grabber_x + grabber_width and 
-                         player_center < right_grabber_x)
-        
-        if left_hit or right_hit or caught_between:
-            return True
-    return False
+    while True:
 
- 
+        # Sample the clock once; everything in this frame uses the same timestamp
 
-# --------------------
+        now = ticks_ms()
 
-# Multiplayer claw drop
 
-# --------------------
 
-def drop_claw_multiplayer():
+        # ===== SOUND =====
 
-    global lives, game_state, claw_y_offset, last_hit_time
+        # Advance the background tone queue
 
-    if game_state != "PLAYING":
+        update_tones(now)
 
-        return
 
- 
 
-    hit_detected = False
+        # ===== INPUT HANDLING =====
 
-    current_time = time.monotonic()
+        # Detect button press (falling edge - was high, now low), ignoring contact
 
- 
+        # bounce by timestamp now that the loop no longer sleeps through it
 
-    # Drop animation
+        current_btn = rot_btn.value
 
-    for step in range(DROP_STEPS + 1):
+        button_pressed = (last_btn_state and (not current_btn)
 
-        offset = step * DROP_STEP_PIXELS
+                          and ticks_diff(now, last_btn_press_ms) > BUTTON_DEBOUNCE_MS)
 
-        claw_y_offset = offset
+        if button_pressed:
 
-        set_claw_y(offset)
+            last_btn_press_ms = now
+
+        last_btn_state = current_btn
 
  
 
-        # Check collision during drop (with cooldown)
+        # ===== ROTARY ENCODER =====
 
-        if check_collision() and not hit_detected and (current_time - last_hit_time) > HIT_COOLDOWN:
+        # Detents turned since last frame (positive = clockwise). Only the menu and
 
-            lives -= 1
+        # initial entry use the encoder, so gameplay frames skip reading it
 
-            update_health_bar()
+        if in_menu or entering_initials:
 
-            hit_detected = True
+            position = encoder.position
 
-            last_hit_time = time.monotonic()
+            rot_delta = position - rot_last_position
 
-            if lives <= 0:
+            rot_last_position = position
 
-                game_state = "GAME_OVER"
+        else:
 
-                message_label.text = f"GAME OVER\nScore: {score}"
+            rot_delta = 0
 
-                game_over_sound()
+        # Any input may change what is on screen (menus, initials, screen switches)
 
- 
+        if button_pressed or rot_delta:
+
+            _frame_dirty = True
 
-        time.sleep(0.03)
+        state_before = game_state
 
  
 
-    time.sleep(0.15)
+        # ===== MENU NAVIGATION =====
 
- 
+        # Rotary encoder changes menu selection when in menu
 
-    # Rise back up (no collision checking on the way up)
+        if in_menu and rot_delta:
 
-    for step in range(DROP_STEPS, -1, -1):
+            menu_index = (menu_index + rot_delta) % len(DIFFICULTY_OPTIONS)
 
-        offset = step * DROP_STEP_PIXELS
+            message_label.text = f"< {DIFFICULTY_OPTIONS[menu_index]} >"
 
-        claw_y_offset = offset
+ 
 
-        set_claw_y(offset)
+        # ===== START GAME FROM MENU =====
 
-        time.sleep(0.03)
+        # Button press in menu starts the selected difficulty
 
- 
+        if in_menu:
 
-    claw_y_offset = CLAW_RESET_Y
-    
-    # Small delay to prevent immediate re-triggering
-    time.sleep(0.1)
+            if button_pressed:
 
- 
+                sel = DIFFICULTY_OPTIONS[menu_index]
 
-# ==============================================================================
+                in_menu = False
 
-# MAIN GAME LOOP
+                if sel == "EASY":
 
-# ==============================================================================
+                    start_easy()
 
-# This loop runs continuously and handles:
+                elif sel == "MEDIUM":
 
-# - Input from rotary encoder (rotation and button press)
+                    start_medium()
 
-# - Menu navigation and difficulty selection
+                elif sel == "HARD":
 
-# - Player movement via accelerometer
+                    start_hard()
 
-# - Claw movement and collision detection  
+                elif sel == "MULTIPLAYER":
 
-# - Score tracking and level progression
+                    start_multiplayer()
 
-# - High score entry and display
+                update_health_bar()
 
-# - UART communication for multiplayer mode
+                message_label.text = ""
 
-while True:
+                # Bring the new game's values into the HUD before showing it
 
-    # ===== INPUT HANDLING =====
+                update_hud(level_time_ms)
 
-    # Detect button press (falling edge - was high, now low)
+                hud_grid.hidden = False
 
-    current_btn = rot_btn.value
+            else:
 
-    button_pressed = last_btn_state and (not current_btn)
+                # Waiting in the menu is the other idle point for a pending write
 
-    last_btn_state = current_btn
+                flush_high_scores()
 
- 
+            if _frame_dirty:
 
-    # ===== MENU NAVIGATION =====
+                display.refresh(target_frames_per_second=None)
 
-    # Rotary encoder changes menu selection when in menu
+                _frame_dirty = False
 
-    current_rot_a = rot_a.value
+            # A tune still playing needs full-rate updates to keep its timing
 
-    if in_menu and (current_rot_a != rot_last_state):
+            slack = (FRAME_MS if tone_queue else IDLE_FRAME_MS) - ticks_diff(ticks_ms(), now)
 
-        if not current_rot_a:
+            if slack > 0:
 
-            if rot_b.value:
+                sleep(slack / 1000)
 
-                menu_index += 1
+            continue
 
-            else:
+ 
 
-                menu_index -= 1
+        # ===== MULTIPLAYER COMMUNICATION =====
 
-            menu_index %= len(DIFFICULTY_OPTIONS)
+        # Process incoming UART data (opponent's aim and fire commands)
 
-            message_label.text = f"< {DIFFICULTY_OPTIONS[menu_index]} >"
+        if multiplayer_active:
 
-        rot_last_state = current_rot_a
+            process_uart()
 
  
 
-    # ===== START GAME FROM MENU =====
+        # ===== STATE DISPATCH =====
 
-    # Button press in menu starts the selected difficulty
+        # Only a running game needs the timer, tilt, claw and level logic; the
 
-    if in_menu:
+        # screens after it just react to the encoder and button
 
-        if button_pressed:
-
-            sel = DIFFICULTY_OPTIONS[menu_index]
+        if game_state == "PLAYING":
 
-            in_menu = False
+            # ===== LEVEL TIMER =====
 
-            if sel == "EASY":
+            # Work out how long is left on the current level
 
-                start_easy()
+            remaining = level_time_ms - ticks_diff(now, level_start_ms)
 
-            elif sel == "MEDIUM":
+            if remaining < 0:
 
-                start_medium()
+                remaining = 0
 
-            elif sel == "HARD":
 
-                start_hard()
 
-            elif sel == "MULTIPLAYER":
+            # ===== PLAYER MOVEMENT =====
 
-                start_multiplayer()
+            # Read accelerometer and move player left/right based on tilt. Tilt
 
-            update_health_bar()
+            # changes slowly, so it is only read every TILT_READ_INTERVAL frames and
 
-            message_label.text = ""
+            # the frames in between reuse the last movement step
 
-        time.sleep(0.02)
+            tilt_countdown -= 1
 
-        continue
+            if tilt_countdown <= 0:
 
- 
+                tilt_countdown = TILT_READ_INTERVAL
 
-    # ===== MULTIPLAYER COMMUNICATION =====
+                # The guard stays on the read: a loose wire or a glitch on the bus
 
-    # Process incoming UART data (opponent's aim and fire commands)
+                # raises OSError mid-game, and that must cost one sample, not the game
 
-    if multiplayer_active:
+                try:
 
-        process_uart()
+                    tilt_x = read_tilt_x()
 
- 
+                except OSError:
 
-    # ===== UI UPDATE =====
+                    tilt_x = 0  # Default to no tilt if a read fails
 
-    # Update timer and display current game stats
 
-    now = time.monotonic()
 
-    remaining = level_time_target - (now - level_start_time)
+                # Map accelerometer tilt to player movement speed (clamped to the tilt range)
 
-    if remaining < 0:
+                if tilt_x < tilt_min:
 
-        remaining = 0
+                    tilt_x = tilt_min
 
-    level_label.text = f"Lv{current_level_index + 1}"  # Display as 1-10 instead of 0-9
+                elif tilt_x > tilt_max:
 
-    lives_label.text = f"L{lives}"
+                    tilt_x = tilt_max
 
-    timer_label.text = f"T:{int(remaining)}s"
+                move_step = tilt_step_lut[tilt_x - tilt_min] - PLAYER_MAX_STEP
 
-    score_label.text = f"S:{score}"
+            player_x += move_step
 
  
 
-    # ===== PLAYER MOVEMENT =====
-
-    # Read accelerometer and move player left/right based on tilt
+            # Keep player on screen
 
-    try:
+            if player_x < 0:
 
-        ax, ay, az = accelerometer.acceleration
+                player_x = 0
 
-    except:
+            if player_x > SCREEN_WIDTH - PLAYER_WIDTH:
 
-        ax = 0  # Default to no tilt if read fails
+                player_x = SCREEN_WIDTH - PLAYER_WIDTH
 
  
 
-    # Map accelerometer tilt to player movement speed
+            # Send player position to opponent in multiplayer
 
-    move_speed = map_range(ax, ACCEL_MIN, ACCEL_MAX, -10, 10)
+            if multiplayer_active:
 
-    player_x += int(move_speed)
+                send_player_position()
 
  
 
-    # Keep player on screen
+            # CLAW CONTROL
 
-    if player_x < 0:
+            if difficulty == "MULTIPLAYER" and multiplayer_active:
 
-        player_x = 0
+                # Opponent controls claw position (aim clamped to the tilt range).
 
-    if player_x > SCREEN_WIDTH - PLAYER_WIDTH:
+                # The claw's x is held for a whole drop, as when the drop blocked
 
-        player_x = SCREEN_WIDTH - PLAYER_WIDTH
+                if drop_phase == DROP_IDLE:
 
-    player_label.x = int(player_x)
+                    aim = opponent_aim_raw
 
- 
+                    if aim < aim_min:
+
+                        aim = aim_min
 
-    # Send player position to opponent in multiplayer
+                    elif aim > aim_max:
 
-    if multiplayer_active:
+                        aim = aim_max
 
-        send_player_position()
+                    claw_x = int(aim * aim_scale + aim_offset)
+
+                    set_claw_x(claw_x)
 
  
 
-    # CLAW CONTROL
+                # Handle fire command (a fire during a drop waits for it to finish)
 
-    if difficulty == "MULTIPLAYER" and multiplayer_active:
+                if fire_flag and drop_phase == DROP_IDLE:
 
-        # Opponent controls claw position
+                    start_claw_drop(now)
 
-        try:
+                    fire_flag = False
 
-            claw_x = int(map_range(opponent_aim_raw, ACCEL_MIN, ACCEL_MAX, 0, SCREEN_WIDTH - CLAW_WIDTH))
+                update_claw_drop(now)
 
-        except Exception:
+ 
 
-            claw_x = claw_line1.x
+            else:
 
-        claw_line1.x = claw_x
+                # Single player - automatic claw
 
-        claw_line2.x = claw_x
+                claw_y_offset += claw_speed
 
-        claw_line3.x = claw_x
+                set_claw_y(claw_y_offset >> CLAW_FRAC_BITS)
 
  
 
-        # Handle fire command
+                if claw_y_offset > CLAW_PASSED_Y:
+
+                    # Successfully dodged! Increment score only if we didn't get hit
 
-        if fire_flag and game_state == "PLAYING":
+                    if not claw_has_hit:
 
-            drop_claw_multiplayer()
+                        score += 1
 
-            fire_flag = False
+                    reset_claw_spawn(random_x=True)
 
  
 
-    elif game_state == "PLAYING":
+                # Only check collision once when claw reaches player, prevent multiple hits
 
-        # Single player - automatic claw
+                if not claw_has_hit and check_collision() and ticks_diff(now, last_hit_ms) > HIT_COOLDOWN_MS:
 
-        claw_y_offset += claw_speed
+                    lives -= 1
 
-        set_claw_y(int(claw_y_offset))
+                    update_health_bar()
 
- 
+                    claw_has_hit = True
 
-        if claw_y_offset > (PLAYER_Y + 8):
+                    last_hit_ms = now
 
-            # Successfully dodged! Increment score only if we didn't get hit
+                    if lives <= 0:
 
-            if not claw_has_hit:
+                        game_state = "GAME_OVER"
 
-                score += 1
+                        message_label.text = f"GAME OVER\nScore: {score}"
 
-            reset_claw_spawn(random_x=True)
+                        game_over_sound()
 
  
 
-        # Only check collision once when claw reaches player, prevent multiple hits
+            # LEVEL COMPLETE (not for multiplayer)
 
-        current_time = time.monotonic()
+            if difficulty != "MULTIPLAYER" and game_state == "PLAYING" and remaining <= 0:
 
-        if not claw_has_hit and check_collision() and (current_time - last_hit_time) > HIT_COOLDOWN:
+                if current_level_index < len(LEVEL_DATA)-1:
 
-            lives -= 1
+                    current_level_index += 1
 
-            update_health_bar()
+                    level_time_ms = LEVEL_DATA_MS[current_level_index]
+
+                    start_level_same_difficulty()
 
-            claw_has_hit = True
+                else:
 
-            last_hit_time = current_time
+                    game_state = "WIN"
 
-            if lives <= 0:
+                    message_label.text = f"YOU WIN!\nScore: {score}"
 
-                game_state = "GAME_OVER"
+                    win_sound()
 
-                message_label.text = f"GAME OVER\nScore: {score}"
+            elif difficulty == "MULTIPLAYER" and game_state == "PLAYING" and remaining <= 0:
 
-                game_over_sound()
+                game_state = "WIN"
+
+                message_label.text = f"YOU SURVIVED!\nScore: {score}"
+
+                win_sound()
 
  
 
-    # LEVEL COMPLETE (not for multiplayer)
+        else:
 
-    if difficulty != "MULTIPLAYER" and game_state == "PLAYING" and remaining <= 0:
+            # A multiplayer drop still running when the game ended finishes its
 
-        if current_level_index < len(LEVEL_DATA)-1:
+            # animation instead of leaving the claw frozen mid-screen
 
-            current_level_index += 1
+            if drop_phase != DROP_IDLE:
 
-            level_time_target = LEVEL_DATA[current_level_index]
+                update_claw_drop(now)
 
-            start_level_same_difficulty()
+            # HIGH SCORE AND MENU HANDLING
 
-        else:
+            if entering_initials:
 
-            game_state = "WIN"
+                # Handle initial entry with rotary encoder
 
-            message_label.text = f"YOU WIN!\nScore: {score}"
+                if rot_delta:
 
-            win_sound()
+                    # Clockwise = next letter, counter-clockwise = prev letter (wrapping A-Z)
 
-    elif difficulty == "MULTIPLAYER" and game_state == "PLAYING" and remaining <= 0:
+                    current_initials[initial_index] = (current_initials[initial_index] + rot_delta) % 26
 
-        game_state = "WIN"
+                    update_initial_display()
 
-        message_label.text = f"YOU SURVIVED!\nScore: {score}"
+        
 
-        win_sound()
+                # Button press moves to next initial or confirms
 
- 
+                if button_pressed:
 
-    # HIGH SCORE AND MENU HANDLING
+                    initial_index += 1
 
-    if entering_initials:
+                    if initial_index >= 3:
 
-        # Handle initial entry with rotary encoder
+                        # Done entering initials
 
-        current_rot_a = rot_a.value
+                        initials_str = ''.join([LETTERS[i] for i in current_initials])
 
-        if current_rot_a != rot_last_state:
+                        add_high_score(initials_str, score)
 
-            if not current_rot_a:
+                        entering_initials = False
 
-                if rot_b.value:
+                        game_state = "SHOW_HIGH_SCORES"
 
-                    # Rotate clockwise - next letter
+                        show_high_scores()
 
-                    ord_val = ord(current_initials[initial_index])
+                    else:
 
-                    ord_val += 1
+                        update_initial_display()
 
-                    if ord_val > ord('Z'):
+    
 
-                        ord_val = ord('A')
+            elif game_state == "SHOW_HIGH_SCORES":
 
-                    current_initials[initial_index] = chr(ord_val)
+                # Showing high scores, press button to return to menu
 
-                else:
+                if button_pressed:
 
-                    # Rotate counter-clockwise - prev letter
+                    drop_phase = DROP_IDLE  # A drop can't carry over into the next game
 
-                    ord_val = ord(current_initials[initial_index])
+                    show_menu()
 
-                    ord_val -= 1
+                    game_state = "PLAYING"
 
-                    if ord_val < ord('A'):
+                else:
 
-                        ord_val = ord('Z')
+                    # The board is already on screen and the player is just reading it,
 
-                    current_initials[initial_index] = chr(ord_val)
+                    # so this is a cheap moment to spend on a flash write
 
-                update_initial_display()
+                    flush_high_scores()
 
-            rot_last_state = current_rot_a
+    
 
-        
+            elif game_state == "GAME_OVER" or game_state == "WIN":
 
-        # Button press moves to next initial or confirms
+                # Check if this is a high score
 
-        if button_pressed:
+                if is_high_score(score):
 
-            initial_index += 1
+                    show_initial_entry()
 
-            if initial_index >= 3:
+                else:
 
-                # Done entering initials
+                    # Not a high score, show high score board
 
-                initials_str = ''.join(current_initials)
+                    game_state = "SHOW_HIGH_SCORES"
 
-                add_high_score(initials_str, score)
+                    show_high_scores()
 
-                entering_initials = False
+ 
 
-                game_state = "SHOW_HIGH_SCORES"
+        # ===== RENDER =====
 
-                show_high_scores()
+        # Game over/win messages and screen switches come with a state change
 
-            else:
+        if game_state != state_before:
 
-                update_initial_display()
+            _frame_dirty = True
 
-    
+        # The HUD only changes while a game runs (and on the frame that ends it);
 
-    elif game_state == "SHOW_HIGH_SCORES":
+        # the screens after it cover or hide it
 
-        # Showing high scores, press button to return to menu
+        if game_state == "PLAYING" or state_before == "PLAYING":
 
-        if button_pressed:
+            update_hud(remaining)
 
-            show_menu()
+        # At most one display refresh per frame, only if something above changed
 
-            game_state = "PLAYING"
+        draw_frame()
 
-    
+ 
 
-    elif game_state == "GAME_OVER" or game_state == "WIN":
+        # Sleep only what is left of this frame's budget; a slow frame runs the
 
-        # Check if this is a high score
+        # next one straight away instead of adding a fixed pause on top
 
-        if is_high_score(score):
+        if game_state == "PLAYING" or tone_queue:
 
-            show_initial_entry()
+            slack = FRAME_MS - ticks_diff(ticks_ms(), now)
 
         else:
 
-            # Not a high score, show high score board
+            slack = IDLE_FRAME_MS - ticks_diff(ticks_ms(), now)
 
-            game_state = "SHOW_HIGH_SCORES"
+        if slack > 0:
 
-            show_high_scores()
+            sleep(slack / 1000)
 
  
 
-    time.sleep(0.01)  # Faster loop for multiplayer
\ No newline at end of file
+run_game_loop()
\ No newline at end of file
@@ -9,11 +9,16 @@ import busio
 import displayio
 import terminalio
 import digitalio
+try:
+    import rotaryio
+except ImportError:  # Not in every port's build (the ESP32-C3 has no pulse counter)
+    rotaryio = None
 import neopixel
 from adafruit_display_text import label
 import i2cdisplaybus
 import adafruit_displayio_ssd1306
 import adafruit_adxl34x
+from adafruit_bus_device.i2c_device import I2CDevice
 
 # --------------------
 # CONFIG
@@ -32,9 +37,12 @@ CLAW_RESET_Y = -10
 
 DROP_STEPS = 10
 DROP_STEP_PIXELS = 3
+DROP_STEP_TIME = 0.03  # seconds between drop animation steps
+DROP_HOLD_TIME = 0.15  # pause at the bottom before rising
 
 ACCEL_MIN = -9.0
 ACCEL_MAX = 9.0
+ADXL345_MS2_PER_COUNT = 0.004 * 9.80665  # full-resolution mode, 4 mg per count
 
 PLAYER_WIDTH = 8
 PLAYER_Y = 52
@@ -45,6 +53,7 @@ LEVEL_DATA = [
 ]
 
 DIFFICULTY_OPTIONS = ["EASY", "MEDIUM", "HARD", "MULTIPLAYER"]
+MENU_TEXT = tuple(f"< {option} >" for option in DIFFICULTY_OPTIONS)  # Label strings, built once
 
 ROT_BTN_PIN = board.D0
 ROT_A_PIN = board.D8
@@ -53,23 +62,37 @@ ROT_B_PIN = board.D9
 LED_PIN = board.D1
 NUM_LEDS = 1
 
+# I2C clock shared by the OLED and ADXL345. Both parts are rated for 400 kHz
+# fast mode, which cuts a full 1 KB display flush from ~90 ms to ~23 ms
+I2C_FREQUENCY = 400000
+
+FRAME_TIME = 0.01  # seconds per main loop pass while playing
+MENU_FRAME_TIME = 0.02  # the menu only polls the encoder and button
+ACCEL_READ_FRAMES = 2  # tilt is read every 2nd frame (50 Hz); the others reuse it
+
 # --------------------
 # util
 # --------------------
-def map_range(x, in_min, in_max, out_min, out_max):
-    if in_min == in_max:
-        return out_min
-    if x < in_min:
-        x = in_min
-    if x > in_max:
-        x = in_max
-    return out_min + (out_max - out_min) * (x - in_min) / (in_max - in_min)
+# Per-frame tilt/aim mapping, folded out of ACCEL_MIN/ACCEL_MAX (set again
+# after calibration): move = (ax - ACCEL_MID) * TILT_SCALE gives -10..10,
+# claw x = (aim - ACCEL_MIN) * AIM_SCALE gives 0..SCREEN_WIDTH - CLAW_WIDTH
+ACCEL_MID = 0.0
+TILT_SCALE = 0.0
+AIM_SCALE = 0.0
+
+def update_accel_mapping():
+    global ACCEL_MID, TILT_SCALE, AIM_SCALE
+    ACCEL_MID = (ACCEL_MIN + ACCEL_MAX) * 0.5
+    TILT_SCALE = 20.0 / (ACCEL_MAX - ACCEL_MIN)
+    AIM_SCALE = (SCREEN_WIDTH - CLAW_WIDTH) / (ACCEL_MAX - ACCEL_MIN)
+
+update_accel_mapping()
 
 # --------------------
 # hardware init
 # --------------------
 displayio.release_displays()
-i2c = busio.I2C(board.SCL, board.SDA)
+i2c = busio.I2C(board.SCL, board.SDA, frequency=I2C_FREQUENCY)
 
 display_bus = i2cdisplaybus.I2CDisplayBus(i2c, device_address=0x3C)
 display = adafruit_displayio_ssd1306.SSD1306(display_bus, width=SCREEN_WIDTH, height=SCREEN_HEIGHT)
@@ -77,17 +100,53 @@ display = adafruit_displayio_ssd1306.SSD1306(display_bus, width=SCREEN_WIDTH, he
 accelerometer = adafruit_adxl34x.ADXL345(i2c)
 accelerometer.range = adafruit_adxl34x.Range.RANGE_2_G
 
+# The driver is only used for setup. Its acceleration property reads and
+# scales all three axes into a new tuple; the game only needs X, so read
+# DATAX0/DATAX1 directly in one I2C transaction into a reused buffer
+adxl_device = I2CDevice(i2c, 0x53)
+_accel_buf = bytearray(2)
+
+def read_accel_x():
+    with adxl_device:
+        adxl_device.write_then_readinto(b"\x32", _accel_buf)
+    raw = _accel_buf[0] | (_accel_buf[1] << 8)
+    if raw & 0x8000:
+        raw -= 65536
+    return raw * ADXL345_MS2_PER_COUNT
+
 rot_btn = digitalio.DigitalInOut(ROT_BTN_PIN)
 rot_btn.switch_to_input(pull=digitalio.Pull.UP)
 last_btn_state = rot_btn.value
 
-rot_a = digitalio.DigitalInOut(ROT_A_PIN)
-rot_a.switch_to_input(pull=digitalio.Pull.UP)
-rot_b = digitalio.DigitalInOut(ROT_B_PIN)
-rot_b.switch_to_input(pull=digitalio.Pull.UP)
-rot_last_state = rot_a.value
-
-pixels = neopixel.NeoPixel(LED_PIN, NUM_LEDS, brightness=0.3, auto_write=True)
+# rotaryio decodes the quadrature in the background (position counts detents);
+# ports built without it poll the pins instead
+class _PolledEncoder:
+    """digitalio stand-in for rotaryio.IncrementalEncoder: one step per falling
+    edge of A (B gives the direction), counted whenever position is read"""
+    def __init__(self, pin_a, pin_b):
+        self._a = digitalio.DigitalInOut(pin_a)
+        self._a.switch_to_input(pull=digitalio.Pull.UP)
+        self._b = digitalio.DigitalInOut(pin_b)
+        self._b.switch_to_input(pull=digitalio.Pull.UP)
+        self._last_a = self._a.value
+        self._position = 0
+
+    @property
+    def position(self):
+        a = self._a.value
+        if a != self._last_a:
+            if not a:
+                self._position += 1 if self._b.value else -1
+            self._last_a = a
+        return self._position
+
+if rotaryio:
+    encoder = rotaryio.IncrementalEncoder(ROT_A_PIN, ROT_B_PIN)
+else:
+    encoder = _PolledEncoder(ROT_A_PIN, ROT_B_PIN)
+rot_last_position = encoder.position
+
+pixels = neopixel.NeoPixel(LED_PIN, NUM_LEDS, brightness=0.3, auto_write=False)  # Written with show()
 
 splash = displayio.Group()
 display.root_group = splash
@@ -124,17 +183,21 @@ splash.append(message_label)
 # --------------------
 start_claw_x = (SCREEN_WIDTH - CLAW_WIDTH) // 2
 
-claw_line1 = label.Label(terminalio.FONT, text="   ||", color=0xFFFFFF, x=start_claw_x, y=CLAW_Y1_BASE)
-claw_line2 = label.Label(terminalio.FONT, text="  ====", color=0xFFFFFF, x=start_claw_x, y=CLAW_Y2_BASE)
-claw_line3 = label.Label(terminalio.FONT, text="  |  |", color=0xFFFFFF, x=start_claw_x, y=CLAW_Y3_BASE)
-splash.append(claw_line1)
-splash.append(claw_line2)
-splash.append(claw_line3)
+# The three lines sit at fixed spots inside one group, so moving the claw is
+# a single x/y write on the group
+claw_group = displayio.Group(x=start_claw_x)
+claw_line1 = label.Label(terminalio.FONT, text="   ||", color=0xFFFFFF, y=CLAW_Y1_BASE)
+claw_line2 = label.Label(terminalio.FONT, text="  ====", color=0xFFFFFF, y=CLAW_Y2_BASE)
+claw_line3 = label.Label(terminalio.FONT, text="  |  |", color=0xFFFFFF, y=CLAW_Y3_BASE)
+claw_group.append(claw_line1)
+claw_group.append(claw_line2)
+claw_group.append(claw_line3)
+splash.append(claw_group)
 
 def set_claw_y(offset):
-    claw_line1.y = CLAW_Y1_BASE + offset
-    claw_line2.y = CLAW_Y2_BASE + offset
-    claw_line3.y = CLAW_Y3_BASE + offset
+    # Slow levels only move the claw a whole pixel every few frames
+    if claw_group.y != offset:
+        claw_group.y = offset
 
 # --------------------
 # Player
@@ -151,14 +214,22 @@ multiplayer_active = False
 opponent_aim_raw = 0.0
 fire_flag = False
 last_player_x = 0
+_rx_buf = b""  # Received bytes not yet parsed (a partial line)
+UART_RX_LIMIT = 64  # Longest partial line kept; anything longer is noise
+_rx_resync = False  # True after noise was dropped mid-line: skip to the next newline
+_pos_buf = bytearray(b"P:000\n")  # Reused position message, digits filled in per send
+POSITION_SEND_FRAMES = 2  # a position goes out at most every 2nd frame (50 Hz)
+send_countdown = 0  # frames until another position may be sent
 
 def init_multiplayer_uart():
-    global uart, multiplayer_active, opponent_aim_raw, fire_flag
+    global uart, multiplayer_active, opponent_aim_raw, fire_flag, _rx_buf, _rx_resync
     try:
-        uart = busio.UART(tx=board.D6, rx=board.D7, baudrate=115200, timeout=0.01)
+        uart = busio.UART(tx=board.D6, rx=board.D7, baudrate=115200, timeout=0)
         multiplayer_active = True
         opponent_aim_raw = 0.0
         fire_flag = False
+        _rx_buf = b""
+        _rx_resync = False
         print("Multiplayer UART initialized.")
     except Exception as e:
         uart = None
@@ -177,42 +248,69 @@ def deinit_multiplayer_uart():
 
 def process_uart():
     """Receive claw position and fire commands"""
-    global opponent_aim_raw, fire_flag
+    global opponent_aim_raw, fire_flag, _rx_buf, _rx_resync
     if not multiplayer_active or not uart:
         return
-    # Read all available data to get latest state
-    while True:
-        try:
-            data = uart.readline()
-        except Exception:
+    # Only take what has already arrived; readline() would wait out the
+    # timeout for a newline that may not have been sent yet
+    try:
+        waiting = uart.in_waiting
+        if not waiting:
             return
-        if not data:
+        data = uart.read(waiting)
+    except Exception:
+        return
+    if data:
+        _rx_buf += data
+    # Handle every complete line, keeping a trailing partial one for next time
+    while True:
+        end = _rx_buf.find(b"\n")
+        if end < 0:
+            if len(_rx_buf) > UART_RX_LIMIT:
+                _rx_buf = b""
+                _rx_resync = True
             break
-        try:
-            msg = data.decode().strip()
-        except Exception:
+        line = _rx_buf[:end]
+        _rx_buf = _rx_buf[end + 1:]
+        if _rx_resync:
+            # The rest of a line whose start was dropped; its tail could
+            # read as a command of its own
+            _rx_resync = False
+            continue
+        if line and line[-1] == 0x0D:  # "\r"
+            line = line[:-1]
+        if not line:
             continue
 
-        if msg.startswith("AIM:"):
+        # Dispatch on the first byte; the raw bytes are matched without decoding
+        first = line[0]
+        if first == 0x41 and line[:4] == b"AIM:":  # "A"
             try:
-                val_str = msg.split(":",1)[1]
-                val = float(val_str)
-                opponent_aim_raw = val
+                opponent_aim_raw = float(line[4:])
             except Exception:
                 pass
-        elif msg == "FIRE:1":
+        elif first == 0x46 and line == b"FIRE:1":  # "F"
             fire_flag = True
 
 def send_player_position():
     """Send our player position to shooter"""
-    global last_player_x
+    global last_player_x, send_countdown
     if not multiplayer_active or not uart:
         return
+    # Tilt moves the player nearly every frame; the shooter only needs the
+    # latest position, so sends are spaced out to leave the link for AIM/FIRE
+    if send_countdown:
+        send_countdown -= 1
+        return
     # Only send if changed
-    if abs(player_x - last_player_x) >= 1:
+    if player_x != last_player_x:
+        send_countdown = POSITION_SEND_FRAMES - 1
         try:
-            msg = f"P:{player_x}\n"
-            uart.write(msg.encode())
+            # Patch the three ASCII digits in place (0-127 always fits)
+            _pos_buf[2] = 48 + player_x // 100
+            _pos_buf[3] = 48 + player_x // 10 % 10
+            _pos_buf[4] = 48 + player_x % 10
+            uart.write(_pos_buf)
             last_player_x = player_x
         except Exception:
             pass
@@ -220,14 +318,23 @@ def send_player_position():
 # --------------------
 # Game state
 # --------------------
+# game_state values (small ints compare faster than strings every frame)
+STATE_PLAYING = 0
+STATE_GAME_OVER = 1
+STATE_WIN = 2
+
 in_menu = True
 menu_index = 0
 difficulty = None
 current_level_index = 0
 level_time_target = LEVEL_DATA[0]
 level_start_time = 0.0
-game_state = "PLAYING"
+game_state = STATE_PLAYING
 lives = 3
+shown_level = -1  # HUD values currently on the labels (-1 = redraw)
+shown_lives = -1
+LEVEL_TEXT = tuple(f"Lv{i}" for i in range(len(LEVEL_DATA)))  # HUD strings, built once
+LIVES_TEXT = ("L0", "L1", "L2", "L3")
 
 claw_y_offset = CLAW_RESET_Y
 claw_speed = INITIAL_CLAW_SPEED
@@ -236,16 +343,18 @@ claw_has_hit = False
 # --------------------
 # Health LEDs
 # --------------------
+# Whole-strip colours for 0..NUM_LEDS lit LEDs (green = life left, blue = life lost),
+# so an update is one slice assignment and one show()
+HEALTH_FRAMES = tuple(((0, 255, 0),) * lit + ((0, 0, 255),) * (NUM_LEDS - lit)
+                      for lit in range(NUM_LEDS + 1))
+
 def update_health_bar():
-    for i in range(NUM_LEDS):
-        if i < lives:
-            pixels[i] = (0, 255, 0)
-        else:
-            pixels[i] = (0, 0, 255)
+    pixels[:] = HEALTH_FRAMES[lives if lives < NUM_LEDS else NUM_LEDS]
+    pixels.show()
 
 def clear_health_bar():
-    for i in range(NUM_LEDS):
-        pixels[i] = (255, 0, 0)
+    pixels.fill((255, 0, 0))
+    pixels.show()
 
 # --------------------
 # Game start functions
@@ -258,16 +367,14 @@ def reset_claw_spawn(random_x=True):
         x = random.randint(0, SCREEN_WIDTH - CLAW_WIDTH)
     else:
         x = (SCREEN_WIDTH - CLAW_WIDTH) // 2
-    claw_line1.x = x
-    claw_line2.x = x
-    claw_line3.x = x
+    claw_group.x = x
 
 def start_easy():
     global difficulty, current_level_index, level_start_time, game_state, lives, claw_speed
     difficulty = "EASY"
     current_level_index = 0
     level_start_time = time.monotonic()
-    game_state = "PLAYING"
+    game_state = STATE_PLAYING
     lives = 3
     title_label.text = "EASY"
     reset_claw_spawn()
@@ -279,7 +386,7 @@ def start_medium():
     difficulty = "MEDIUM"
     current_level_index = 0
     level_start_time = time.monotonic()
-    game_state = "PLAYING"
+    game_state = STATE_PLAYING
     lives = 3
     title_label.text = "MEDIUM"
     reset_claw_spawn()
@@ -291,7 +398,7 @@ def start_hard():
     difficulty = "HARD"
     current_level_index = 0
     level_start_time = time.monotonic()
-    game_state = "PLAYING"
+    game_state = STATE_PLAYING
     lives = 3
     title_label.text = "HARD"
     reset_claw_spawn()
@@ -300,21 +407,20 @@ def start_hard():
 
 def start_multiplayer():
     global difficulty, current_level_index, level_start_time, game_state, lives
-    global claw_y_offset
+    global claw_y_offset, drop_phase
     difficulty = "MULTIPLAYER"
     current_level_index = 0
     level_time_target = 60.0  # 60 second rounds
     level_start_time = time.monotonic()
-    game_state = "PLAYING"
+    game_state = STATE_PLAYING
     lives = 3
     title_label.text = "MULTI"
     claw_y_offset = CLAW_RESET_Y
     set_claw_y(int(claw_y_offset))
+    drop_phase = DROP_IDLE
     # Center claw initially
     x = (SCREEN_WIDTH - CLAW_WIDTH) // 2
-    claw_line1.x = x
-    claw_line2.x = x
-    claw_line3.x = x
+    claw_group.x = x
     init_multiplayer_uart()
 
 def start_level_same_difficulty():
@@ -346,25 +452,36 @@ def calibrate_accelerometer():
     min_x = 0.0
     max_x = 0.0
 
-    while time.monotonic() - calib_start < calib_duration:
+    # Sample as fast as the bus allows so short tilt peaks aren't missed
+    # between readings; only the on-screen readout is held to every 0.1 s
+    next_readout = calib_start
+    ax = None
+    while True:
+        now = time.monotonic()
+        if now - calib_start >= calib_duration:
+            break
         try:
-            ax, ay, az = accelerometer.acceleration
+            ax = read_accel_x()
             if ax < min_x:
                 min_x = ax
             if ax > max_x:
                 max_x = ax
-
-            remaining = calib_duration - (time.monotonic() - calib_start)
-            accel_label.text = f"X:{ax:.1f}\n{min_x:.1f} to {max_x:.1f}\n{remaining:.1f}s"
         except:
-            accel_label.text = "Error reading"
+            ax = None
 
-        time.sleep(0.1)
+        if now >= next_readout:
+            next_readout += 0.1
+            if ax is None:
+                accel_label.text = "Error reading"
+            else:
+                remaining = calib_duration - (now - calib_start)
+                accel_label.text = f"X:{ax:.1f}\n{min_x:.1f} to {max_x:.1f}\n{remaining:.1f}s"
 
     # Apply calibration values
     if abs(max_x - min_x) > 1.0:  # Only apply if there was meaningful tilt
         ACCEL_MIN = min_x
         ACCEL_MAX = max_x
+        update_accel_mapping()
         message_label.text = "Calibrated!"
     else:
         message_label.text = "Not enough tilt"
@@ -378,11 +495,12 @@ def calibrate_accelerometer():
 # Menu
 # --------------------
 def show_menu():
-    global in_menu
+    global in_menu, rot_last_position
     in_menu = True
+    rot_last_position = encoder.position  # Ignore turns made during the game
     clear_health_bar()
     title_label.text = "MENU"
-    message_label.text = f"< {DIFFICULTY_OPTIONS[menu_index]} >"
+    message_label.text = MENU_TEXT[menu_index]
     reset_claw_spawn(random_x=False)
     set_claw_y(CLAW_RESET_Y)
     deinit_multiplayer_uart()
@@ -395,83 +513,100 @@ show_menu()
 # --------------------
 # Collision
 # --------------------
+# Only count as a hit when the claw's bottom line (line3) is at, or very near,
+# the player's Y; that window is fixed, so it is folded into claw group y limits.
+# This avoids counting hits when the claw has already passed the player or is far above.
+VERTICAL_TOLERANCE = DROP_STEP_PIXELS if DROP_STEP_PIXELS > 0 else 1
+CLAW_HIT_Y_MIN = PLAYER_Y - CLAW_Y3_BASE - VERTICAL_TOLERANCE
+CLAW_HIT_Y_MAX = PLAYER_Y - CLAW_Y3_BASE + VERTICAL_TOLERANCE
+PLAYER_HALF = PLAYER_WIDTH // 2
+
 def check_collision():
     """Only check collision with the bottom grabbing part of the claw (line 3)"""
-    claw_left = claw_line1.x
-    claw_right = claw_left + CLAW_WIDTH
-    player_center = player_x + PLAYER_WIDTH // 2
-
-    # Only the bottom claw line (line3) can hit you
-    claw_bottom = claw_line3.y
-
-    # Only trigger when the bottom part is at or past the player level
-    # Only count as a hit when the claw's bottom is at (or very near) the player's Y.
-    # This avoids counting hits when the claw has already passed the player or is far above.
-    vertical_tolerance = DROP_STEP_PIXELS if DROP_STEP_PIXELS > 0 else 1
-    if abs(claw_bottom - PLAYER_Y) <= vertical_tolerance:
-        if claw_left <= player_center <= claw_right:
-            return True
-    return False
+    if not CLAW_HIT_Y_MIN <= claw_group.y <= CLAW_HIT_Y_MAX:
+        return False
+    # Player center relative to the claw's left edge
+    offset = player_x + PLAYER_HALF - claw_group.x
+    return 0 <= offset <= CLAW_WIDTH
 
 # --------------------
 # Multiplayer claw drop
 # --------------------
-def drop_claw_multiplayer():
-    global lives, game_state, claw_y_offset
-    if game_state != "PLAYING":
+# The drop runs one step per main-loop pass so UART and input keep being polled
+# (deadlines follow on from each other, so a slow pass doesn't stretch the drop)
+DROP_IDLE = 0
+DROP_FALLING = 1
+DROP_RISING = 2
+
+drop_phase = DROP_IDLE
+drop_step = 0
+drop_next_time = 0.0
+drop_hit = False
+DROP_OFFSETS = tuple(step * DROP_STEP_PIXELS for step in range(DROP_STEPS + 1))  # claw y per step
+
+def start_claw_drop(now):
+    global drop_phase, drop_step, drop_next_time, drop_hit
+    if game_state != STATE_PLAYING:
+        return
+    drop_phase = DROP_FALLING
+    drop_step = 0
+    drop_next_time = now
+    drop_hit = False
+
+def update_claw_drop(now):
+    """Advance the drop animation when its next step is due"""
+    global lives, game_state, claw_y_offset, drop_phase, drop_step, drop_next_time, drop_hit
+    if drop_phase == DROP_IDLE or now < drop_next_time:
         return
 
-    hit_detected = False
-
-    # Drop animation
-    for step in range(DROP_STEPS + 1):
-        offset = step * DROP_STEP_PIXELS
-        claw_y_offset = offset
-        set_claw_y(offset)
+    claw_y_offset = DROP_OFFSETS[drop_step]
+    set_claw_y(claw_y_offset)
 
+    if drop_phase == DROP_FALLING:
         # Check collision during drop
-        if check_collision() and not hit_detected:
+        if check_collision() and not drop_hit:
             lives -= 1
             update_health_bar()
-            hit_detected = True
+            drop_hit = True
             if lives <= 0:
-                game_state = "GAME_OVER"
+                game_state = STATE_GAME_OVER
                 message_label.text = "GAME OVER"
 
-        time.sleep(0.03)
-
-    time.sleep(0.15)
-
-    # Rise back up
-    for step in range(DROP_STEPS, -1, -1):
-        offset = step * DROP_STEP_PIXELS
-        claw_y_offset = offset
-        set_claw_y(offset)
-        time.sleep(0.03)
-
-    claw_y_offset = CLAW_RESET_Y
+        if drop_step < DROP_STEPS:
+            drop_step += 1
+            drop_next_time += DROP_STEP_TIME
+        else:
+            # Hold at the bottom, then rise back up
+            drop_phase = DROP_RISING
+            drop_next_time += DROP_STEP_TIME + DROP_HOLD_TIME
+    elif drop_step > 0:
+        drop_step -= 1
+        drop_next_time += DROP_STEP_TIME
+    else:
+        drop_phase = DROP_IDLE
+        claw_y_offset = CLAW_RESET_Y
 
 # --------------------
 # Main loop
 # --------------------
+# Frames run to a deadline, so the work done in a frame comes out of its sleep
+# instead of adding to it; after an overrun the schedule restarts from now
+next_frame = time.monotonic()
+accel_countdown = 0  # frames until the next accelerometer read
+ax = 0
 while True:
     current_btn = rot_btn.value
     button_pressed = last_btn_state and (not current_btn)
     last_btn_state = current_btn
 
-    current_rot_a = rot_a.value
-    if in_menu and (current_rot_a != rot_last_state):
-        if not current_rot_a:
-            if rot_b.value:
-                menu_index += 1
-            else:
-                menu_index -= 1
-            menu_index %= len(DIFFICULTY_OPTIONS)
-            message_label.text = f"< {DIFFICULTY_OPTIONS[menu_index]} >"
-        rot_last_state = current_rot_a
-
-    # MENU SELECTION
+    # MENU SELECTION (the encoder is only read while the menu is up)
     if in_menu:
+        position = encoder.position
+        rot_delta = position - rot_last_position
+        rot_last_position = position
+        if rot_delta:
+            menu_index = (menu_index + rot_delta) % len(DIFFICULTY_OPTIONS)
+            message_label.text = MENU_TEXT[menu_index]
         if button_pressed:
             sel = DIFFICULTY_OPTIONS[menu_index]
             in_menu = False
@@ -485,7 +620,12 @@ while True:
                 start_multiplayer()
             update_health_bar()
             message_label.text = ""
-        time.sleep(0.02)
+        next_frame += MENU_FRAME_TIME
+        delay = next_frame - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        else:
+            next_frame = time.monotonic()
         continue
 
     # Process UART if multiplayer
@@ -497,23 +637,36 @@ while True:
     remaining = level_time_target - (now - level_start_time)
     if remaining < 0:
         remaining = 0
-    level_label.text = f"Lv{current_level_index}"
-    lives_label.text = f"L{lives}"
+    if current_level_index != shown_level:
+        level_label.text = LEVEL_TEXT[current_level_index]
+        shown_level = current_level_index
+    if lives != shown_lives:
+        lives_label.text = LIVES_TEXT[lives]
+        shown_lives = lives
 
     # PLAYER MOVEMENT (always local control)
-    try:
-        ax, ay, az = accelerometer.acceleration
-    except:
-        ax = 0
+    if accel_countdown:
+        accel_countdown -= 1
+    else:
+        accel_countdown = ACCEL_READ_FRAMES - 1
+        try:
+            ax = read_accel_x()
+        except:
+            ax = 0
 
-    move_speed = map_range(ax, ACCEL_MIN, ACCEL_MAX, -10, 10)
-    player_x += int(move_speed)
+    if ax < ACCEL_MIN:
+        ax = ACCEL_MIN
+    elif ax > ACCEL_MAX:
+        ax = ACCEL_MAX
+    player_x += int((ax - ACCEL_MID) * TILT_SCALE)
 
     if player_x < 0:
         player_x = 0
     if player_x > SCREEN_WIDTH - PLAYER_WIDTH:
         player_x = SCREEN_WIDTH - PLAYER_WIDTH
-    player_label.x = int(player_x)
+    # Unchanged positions are not written, so a still frame leaves nothing dirty
+    if player_label.x != player_x:
+        player_label.x = player_x
 
     # Send player position in multiplayer
     if multiplayer_active:
@@ -521,21 +674,24 @@ while True:
 
     # CLAW CONTROL
     if difficulty == "MULTIPLAYER" and multiplayer_active:
-        # Opponent controls claw position
-        try:
-            claw_x = int(map_range(opponent_aim_raw, ACCEL_MIN, ACCEL_MAX, 0, SCREEN_WIDTH - CLAW_WIDTH))
-        except Exception:
-            claw_x = claw_line1.x
-        claw_line1.x = claw_x
-        claw_line2.x = claw_x
-        claw_line3.x = claw_x
-
-        # Handle fire command
-        if fire_flag and game_state == "PLAYING":
-            drop_claw_multiplayer()
+        # Opponent controls claw position (held for a whole drop)
+        if drop_phase == DROP_IDLE:
+            aim = opponent_aim_raw
+            if aim < ACCEL_MIN:
+                aim = ACCEL_MIN
+            elif aim > ACCEL_MAX:
+                aim = ACCEL_MAX
+            claw_x = int((aim - ACCEL_MIN) * AIM_SCALE)
+            if claw_group.x != claw_x:
+                claw_group.x = claw_x
+
+        # Handle fire command (a fire during a drop waits for it to finish)
+        if fire_flag and drop_phase == DROP_IDLE and game_state == STATE_PLAYING:
+            start_claw_drop(now)
             fire_flag = False
+        update_claw_drop(now)
 
-    elif game_state == "PLAYING":
+    elif game_state == STATE_PLAYING:
         # Single player - automatic claw
         claw_y_offset += claw_speed
         set_claw_y(int(claw_y_offset))
@@ -549,25 +705,30 @@ while True:
             update_health_bar()
             claw_has_hit = True
             if lives <= 0:
-                game_state = "GAME_OVER"
+                game_state = STATE_GAME_OVER
                 message_label.text = "GAME OVER"
 
     # LEVEL COMPLETE (not for multiplayer)
-    if difficulty != "MULTIPLAYER" and game_state == "PLAYING" and remaining <= 0:
+    if difficulty != "MULTIPLAYER" and game_state == STATE_PLAYING and remaining <= 0:
         if current_level_index < len(LEVEL_DATA)-1:
             current_level_index += 1
             level_time_target = LEVEL_DATA[current_level_index]
             start_level_same_difficulty()
         else:
-            game_state = "WIN"
+            game_state = STATE_WIN
             message_label.text = "YOU WIN!"
-    elif difficulty == "MULTIPLAYER" and game_state == "PLAYING" and remaining <= 0:
-        game_state = "WIN"
+    elif difficulty == "MULTIPLAYER" and game_state == STATE_PLAYING and remaining <= 0:
+        game_state = STATE_WIN
         message_label.text = "YOU SURVIVED!"
 
     # RETURN TO MENU
-    if button_pressed and game_state in ("GAME_OVER", "WIN"):
+    if button_pressed and game_state != STATE_PLAYING:
         show_menu()
 
-    time.sleep(0.01)  # Faster loop for multiplayer
+    next_frame += FRAME_TIME
+    delay = next_frame - time.monotonic()
+    if delay > 0:
+        time.sleep(delay)
+    else:
+        next_frame = time.monotonic()
 
@@ -9,11 +9,17 @@ import busio
 import displayio
 import terminalio
 import digitalio
+try:
+    import rotaryio
+except ImportError:  # Not in every port's build (the ESP32-C3 has no pulse counter)
+    rotaryio = None
+from supervisor import ticks_ms
 import neopixel
 from adafruit_display_text import label
 import i2cdisplaybus
 import adafruit_displayio_ssd1306
 import adafruit_adxl34x
+from adafruit_bus_device.i2c_device import I2CDevice
 
 # --------------------
 # CONFIG
@@ -32,6 +38,7 @@ CLAW_RESET_Y = -10
 
 ACCEL_MIN = -9.0
 ACCEL_MAX = 9.0
+ADXL345_MS2_PER_COUNT = 0.004 * 9.80665  # full-resolution mode, 4 mg per count
 
 PLAYER_WIDTH = 8
 PLAYER_Y = 52
@@ -40,9 +47,14 @@ LEVEL_DATA = [
     15.0, 14.0, 13.0, 12.0, 11.0,
     10.0, 9.0, 8.0, 7.0, 6.0
 ]
+LEVEL_DATA_MS = [int(seconds * 1000) for seconds in LEVEL_DATA]
 
 DIFFICULTY_OPTIONS = ["EASY", "MEDIUM", "HARD"]
 
+FRAME_SLEEP = 0.02  # seconds per gameplay frame
+# menu and game over screens only wait for input (polled encoder pins need the full rate)
+IDLE_FRAME_SLEEP = 0.05 if rotaryio else FRAME_SLEEP
+
 ROT_BTN_PIN = board.D0
 ROT_A_PIN = board.D8
 ROT_B_PIN = board.D9
@@ -50,41 +62,96 @@ ROT_B_PIN = board.D9
 LED_PIN = board.D1
 NUM_LEDS = 1
 
+# I2C clock shared by the OLED and ADXL345. Both parts are rated for 400 kHz
+# fast mode, which cuts a full 1 KB display flush from ~90 ms to ~23 ms
+I2C_FREQUENCY = 400000
+
 # --------------------
 # util
 # --------------------
 def map_range(x, in_min, in_max, out_min, out_max):
-    if in_min == in_max:
-        return out_min
+    # Callers pass fixed, distinct bounds, so there is no in_min == in_max case
     if x < in_min:
         x = in_min
-    if x > in_max:
+    elif x > in_max:
         x = in_max
     return out_min + (out_max - out_min) * (x - in_min) / (in_max - in_min)
 
+# ticks_ms() is a small int (no float allocation like time.monotonic()) that
+# wraps every 2**29 ms, so differences go through ticks_diff()
+TICKS_MAX = (1 << 29) - 1
+TICKS_HALFPERIOD = 1 << 28
+
+def ticks_diff(end, start):
+    diff = (end - start) & TICKS_MAX
+    return ((diff + TICKS_HALFPERIOD) & TICKS_MAX) - TICKS_HALFPERIOD
+
 # --------------------
 # hardware init
 # --------------------
 displayio.release_displays()
-i2c = busio.I2C(board.SCL, board.SDA)
+i2c = busio.I2C(board.SCL, board.SDA, frequency=I2C_FREQUENCY)
 
 display_bus = i2cdisplaybus.I2CDisplayBus(i2c, device_address=0x3C)
 display = adafruit_displayio_ssd1306.SSD1306(display_bus, width=SCREEN_WIDTH, height=SCREEN_HEIGHT)
+# Every label write would otherwise schedule its own refresh; the main loop
+# pushes one refresh per frame instead (with no target frame rate, since
+# refresh() would drop calls arriving more than one target frame apart)
+display.auto_refresh = False
+# displayio already sends only the dirty rectangles of each refresh, windowed
+# with the SSD1306 column/page address commands, so a frame where just the
+# player moved costs a few bytes on the bus, not the whole 1 KB framebuffer.
+# Don't write pixel data to 0x3C directly: displayio owns the panel.
 
 accelerometer = adafruit_adxl34x.ADXL345(i2c)
 accelerometer.range = adafruit_adxl34x.Range.RANGE_2_G
 
+# The driver reads and scales all three axes; the game only needs X, so read
+# DATAX0/DATAX1 directly in one I2C transaction into a reused buffer
+adxl_device = I2CDevice(i2c, 0x53)
+_accel_buf = bytearray(2)
+
+def read_accel_x():
+    with adxl_device:
+        adxl_device.write_then_readinto(b"\x32", _accel_buf)
+    raw = _accel_buf[0] | (_accel_buf[1] << 8)
+    if raw & 0x8000:
+        raw -= 65536
+    return raw * ADXL345_MS2_PER_COUNT
+
 rot_btn = digitalio.DigitalInOut(ROT_BTN_PIN)
 rot_btn.switch_to_input(pull=digitalio.Pull.UP)
 last_btn_state = rot_btn.value
 
-rot_a = digitalio.DigitalInOut(ROT_A_PIN)
-rot_a.switch_to_input(pull=digitalio.Pull.UP)
-rot_b = digitalio.DigitalInOut(ROT_B_PIN)
-rot_b.switch_to_input(pull=digitalio.Pull.UP)
-rot_last_state = rot_a.value
-
-pixels = neopixel.NeoPixel(LED_PIN, NUM_LEDS, brightness=0.3, auto_write=True)
+# rotaryio decodes the quadrature in the background (position counts detents);
+# ports built without it poll the pins instead
+class _PolledEncoder:
+    """digitalio stand-in for rotaryio.IncrementalEncoder: one step per falling
+    edge of A (B gives the direction), counted whenever position is read"""
+    def __init__(self, pin_a, pin_b):
+        self._a = digitalio.DigitalInOut(pin_a)
+        self._a.switch_to_input(pull=digitalio.Pull.UP)
+        self._b = digitalio.DigitalInOut(pin_b)
+        self._b.switch_to_input(pull=digitalio.Pull.UP)
+        self._last_a = self._a.value
+        self._position = 0
+
+    @property
+    def position(self):
+        a = self._a.value
+        if a != self._last_a:
+            if not a:
+                self._position += 1 if self._b.value else -1
+            self._last_a = a
+        return self._position
+
+if rotaryio:
+    encoder = rotaryio.IncrementalEncoder(ROT_A_PIN, ROT_B_PIN)
+else:
+    encoder = _PolledEncoder(ROT_A_PIN, ROT_B_PIN)
+rot_last_position = encoder.position
+
+pixels = neopixel.NeoPixel(LED_PIN, NUM_LEDS, brightness=0.3, auto_write=False)  # Written with show()
 
 splash = displayio.Group()
 display.root_group = splash
@@ -119,19 +186,43 @@ splash.append(message_label)
 # --------------------
 # Claw
 # --------------------
+# The three claw lines are painted once into one bitmap and shown as a single
+# TileGrid, so moving the claw dirties one rectangle instead of three labels
 start_claw_x = (SCREEN_WIDTH - CLAW_WIDTH) // 2
 
-claw_line1 = label.Label(terminalio.FONT, text="   ||", color=0xFFFFFF, x=start_claw_x, y=CLAW_Y1_BASE)
-claw_line2 = label.Label(terminalio.FONT, text="  ====", color=0xFFFFFF, x=start_claw_x, y=CLAW_Y2_BASE)
-claw_line3 = label.Label(terminalio.FONT, text="  |  |", color=0xFFFFFF, x=start_claw_x, y=CLAW_Y3_BASE)
-splash.append(claw_line1)
-splash.append(claw_line2)
-splash.append(claw_line3)
+CLAW_LINES = (("   ||", CLAW_Y1_BASE), ("  ====", CLAW_Y2_BASE), ("  |  |", CLAW_Y3_BASE))
+glyph_width, glyph_height = terminalio.FONT.get_bounding_box()[:2]
+# A label's y is the middle of its line, so the sprite starts half a glyph higher
+CLAW_SPRITE_TOP = CLAW_Y1_BASE - glyph_height // 2
+
+claw_bitmap = displayio.Bitmap(CLAW_WIDTH, CLAW_Y3_BASE - CLAW_Y1_BASE + glyph_height, 2)
+for claw_text, line_y in CLAW_LINES:
+    x = 0
+    for char in claw_text:
+        glyph = terminalio.FONT.get_glyph(ord(char))
+        if glyph is not None:
+            # Glyphs are tiles in the font's shared bitmap
+            tiles_per_row = glyph.bitmap.width // glyph.width
+            tile_x = (glyph.tile_index % tiles_per_row) * glyph.width
+            tile_y = (glyph.tile_index // tiles_per_row) * glyph.height
+            for gy in range(glyph.height):
+                for gx in range(glyph.width):
+                    if glyph.bitmap[tile_x + gx, tile_y + gy] and x + gx < CLAW_WIDTH:
+                        claw_bitmap[x + gx, line_y - CLAW_Y1_BASE + gy] = 1
+        x += glyph_width
+
+claw_palette = displayio.Palette(2)
+claw_palette[0] = 0x000000
+claw_palette[1] = 0xFFFFFF
+claw_palette.make_transparent(0)
+claw_sprite = displayio.TileGrid(claw_bitmap, pixel_shader=claw_palette, x=start_claw_x, y=CLAW_SPRITE_TOP)
+splash.append(claw_sprite)
 
 def set_claw_y(offset):
-    claw_line1.y = CLAW_Y1_BASE + offset
-    claw_line2.y = CLAW_Y2_BASE + offset
-    claw_line3.y = CLAW_Y3_BASE + offset
+    # Slow levels only move the claw a whole pixel every few frames
+    y = CLAW_SPRITE_TOP + offset
+    if claw_sprite.y != y:
+        claw_sprite.y = y
 
 # --------------------
 # Player
@@ -147,10 +238,14 @@ in_menu = True
 menu_index = 0
 difficulty = None
 current_level_index = 0
-level_time_target = LEVEL_DATA[0]
-level_start_time = 0.0
+level_time_ms = LEVEL_DATA_MS[0]
+level_start_ms = 0
 game_state = "PLAYING"
 lives = 3
+shown_level = -1  # HUD values currently on the labels (-1 = redraw)
+shown_lives = -1
+LEVEL_TEXT = tuple(f"Lv{i}" for i in range(len(LEVEL_DATA)))  # HUD strings, built once
+LIVES_TEXT = ("L0", "L1", "L2", "L3")
 
 claw_y_offset = CLAW_RESET_Y
 claw_speed = INITIAL_CLAW_SPEED 
@@ -158,16 +253,18 @@ claw_speed = INITIAL_CLAW_SPEED
 # --------------------
 # Health LEDs
 # --------------------
+# Whole-strip colours for 0..NUM_LEDS lit LEDs (green = life left, blue = life lost),
+# so an update is one slice assignment and one show()
+HEALTH_FRAMES = tuple(((0, 255, 0),) * lit + ((0, 0, 255),) * (NUM_LEDS - lit)
+                      for lit in range(NUM_LEDS + 1))
+
 def update_health_bar():
-    for i in range(NUM_LEDS):
-        if i < lives:
-            pixels[i] = (0, 255, 0)
-        else:
-            pixels[i] = (0, 0, 255)
+    pixels[:] = HEALTH_FRAMES[lives if lives < NUM_LEDS else NUM_LEDS]
+    pixels.show()
 
 def clear_health_bar():
-    for i in range(NUM_LEDS):
-        pixels[i] = (255, 0, 0)
+    pixels.fill((255, 0, 0))
+    pixels.show()
 
 # --------------------
 # Game start functions
@@ -179,15 +276,13 @@ def reset_claw_spawn(random_x=True):
         x = random.randint(0, SCREEN_WIDTH - CLAW_WIDTH)
     else:
         x = (SCREEN_WIDTH - CLAW_WIDTH) // 2
-    claw_line1.x = x
-    claw_line2.x = x
-    claw_line3.x = x
+    claw_sprite.x = x
 
 def start_easy():
-    global difficulty, current_level_index, level_start_time, game_state, lives, claw_speed
+    global difficulty, current_level_index, level_start_ms, game_state, lives, claw_speed
     difficulty = "EASY"
     current_level_index = 0
-    level_start_time = time.monotonic()
+    level_start_ms = ticks_ms()
     game_state = "PLAYING"
     lives = 3
     title_label.text = "EASY"
@@ -195,10 +290,10 @@ def start_easy():
     claw_speed = INITIAL_CLAW_SPEED
 
 def start_medium():
-    global difficulty, current_level_index, level_start_time, game_state, lives, claw_speed
+    global difficulty, current_level_index, level_start_ms, game_state, lives, claw_speed
     difficulty = "MEDIUM"
     current_level_index = 0
-    level_start_time = time.monotonic()
+    level_start_ms = ticks_ms()
     game_state = "PLAYING"
     lives = 3
     title_label.text = "MEDIUM"
@@ -206,10 +301,10 @@ def start_medium():
     claw_speed = INITIAL_CLAW_SPEED + 0.4
 
 def start_hard():
-    global difficulty, current_level_index, level_start_time, game_state, lives, claw_speed
+    global difficulty, current_level_index, level_start_ms, game_state, lives, claw_speed
     difficulty = "HARD"
     current_level_index = 0
-    level_start_time = time.monotonic()
+    level_start_ms = ticks_ms()
     game_state = "PLAYING"
     lives = 3
     title_label.text = "HARD"
@@ -217,8 +312,8 @@ def start_hard():
     claw_speed = INITIAL_CLAW_SPEED + 0.8
 
 def start_level_same_difficulty():
-    global level_start_time, claw_speed, current_level_index
-    level_start_time = time.monotonic()
+    global level_start_ms, claw_speed, current_level_index
+    level_start_ms = ticks_ms()
     reset_claw_spawn()
     claw_speed = INITIAL_CLAW_SPEED + CLAW_SPEED_STEP * current_level_index
 
@@ -226,8 +321,9 @@ def start_level_same_difficulty():
 # Menu
 # --------------------
 def show_menu():
-    global in_menu
+    global in_menu, rot_last_position
     in_menu = True
+    rot_last_position = encoder.position  # Ignore turns made during the game
     clear_health_bar()
     title_label.text = "MENU"
     message_label.text = f"< {DIFFICULTY_OPTIONS[menu_index]} >"
@@ -239,16 +335,17 @@ show_menu()
 # --------------------
 # Collision
 # --------------------
-def check_collision():
-    claw_left = claw_line1.x
-    claw_right = claw_left + CLAW_WIDTH
-    player_center = player_x + PLAYER_WIDTH // 2
-    claw_bottom = CLAW_Y3_BASE + int(claw_y_offset)
+# The claw bottom reaches the player once claw_y_offset hits CLAW_HIT_OFFSET;
+# checked first since the claw is above the player on most frames
+CLAW_HIT_OFFSET = PLAYER_Y - 2 - CLAW_Y3_BASE
+PLAYER_HALF = PLAYER_WIDTH // 2
 
-    if claw_bottom >= PLAYER_Y - 2:
-        if claw_left <= player_center <= claw_right:
-            return True
-    return False
+def check_collision():
+    if claw_y_offset < CLAW_HIT_OFFSET:
+        return False
+    # Player center relative to the claw's left edge
+    offset = player_x + PLAYER_HALF - claw_sprite.x
+    return 0 <= offset <= CLAW_WIDTH
 
 # --------------------
 # Main loop
@@ -258,19 +355,14 @@ while True:
     button_pressed = last_btn_state and (not current_btn)
     last_btn_state = current_btn
 
-    current_rot_a = rot_a.value
-    if in_menu and (current_rot_a != rot_last_state):
-        if not current_rot_a:
-            if rot_b.value:
-                menu_index += 1
-            else:
-                menu_index -= 1
-            menu_index %= len(DIFFICULTY_OPTIONS)
-            message_label.text = f"< {DIFFICULTY_OPTIONS[menu_index]} >"
-        rot_last_state = current_rot_a
-
-    # MENU SELECTION
+    # MENU SELECTION (the encoder is only read while the menu is up)
     if in_menu:
+        position = encoder.position
+        rot_delta = position - rot_last_position
+        rot_last_position = position
+        if rot_delta:
+            menu_index = (menu_index + rot_delta) % len(DIFFICULTY_OPTIONS)
+            message_label.text = f"< {DIFFICULTY_OPTIONS[menu_index]} >"
         if button_pressed:
             sel = DIFFICULTY_OPTIONS[menu_index]
             in_menu = False
@@ -282,21 +374,34 @@ while True:
                 start_hard()
             update_health_bar()
             message_label.text = ""
-        time.sleep(0.02)
+        display.refresh(target_frames_per_second=None)
+        time.sleep(IDLE_FRAME_SLEEP)
         continue
 
     # TIMER UPDATE
-    now = time.monotonic()
-    remaining = level_time_target - (now - level_start_time)
+    now = ticks_ms()
+    remaining = level_time_ms - ticks_diff(now, level_start_ms)
     if remaining < 0:
         remaining = 0
-    #timer_label.text = f"{remaining:4.1f}"
-    level_label.text = f"Lv{current_level_index}"
-    lives_label.text = f"L{lives}"
+    #timer_label.text = f"{remaining / 1000:4.1f}"
+    if current_level_index != shown_level:
+        level_label.text = LEVEL_TEXT[current_level_index]
+        shown_level = current_level_index
+    if lives != shown_lives:
+        lives_label.text = LIVES_TEXT[lives]
+        shown_lives = lives
+
+    # GAME OVER / WIN: nothing moves any more, just wait for the button
+    if game_state != "PLAYING":
+        if button_pressed:
+            show_menu()
+        display.refresh(target_frames_per_second=None)
+        time.sleep(IDLE_FRAME_SLEEP)
+        continue
 
     # PLAYER MOVEMENT
     try:
-        ax, ay, az = accelerometer.acceleration
+        ax = read_accel_x()
     except:
         ax = 0
 
@@ -307,36 +412,34 @@ while True:
         player_x = 0
     if player_x > SCREEN_WIDTH - PLAYER_WIDTH:
         player_x = SCREEN_WIDTH - PLAYER_WIDTH
-    player_label.x = int(player_x)
+    # Unchanged positions are not written, so a still frame leaves nothing dirty
+    if player_label.x != player_x:
+        player_label.x = player_x
 
     # CLAW MOVEMENT
-    if game_state == "PLAYING":
-        claw_y_offset += claw_speed
-        set_claw_y(int(claw_y_offset))
+    claw_y_offset += claw_speed
+    set_claw_y(int(claw_y_offset))
 
-        if claw_y_offset > (PLAYER_Y + 8):
-            reset_claw_spawn(random_x=True)
+    if claw_y_offset > (PLAYER_Y + 8):
+        reset_claw_spawn(random_x=True)
 
-        if check_collision():
-            lives -= 1
-            update_health_bar()
-            reset_claw_spawn(random_x=True)
-            if lives <= 0:
-                game_state = "GAME_OVER"
-                message_label.text = "GAME OVER"
+    if check_collision():
+        lives -= 1
+        update_health_bar()
+        reset_claw_spawn(random_x=True)
+        if lives <= 0:
+            game_state = "GAME_OVER"
+            message_label.text = "GAME OVER"
 
     # LEVEL COMPLETE
     if game_state == "PLAYING" and remaining <= 0:
         if current_level_index < len(LEVEL_DATA)-1:
             current_level_index += 1
-            level_time_target = LEVEL_DATA[current_level_index]
+            level_time_ms = LEVEL_DATA_MS[current_level_index]
             start_level_same_difficulty()
         else:
             game_state = "WIN"
             message_label.text = "YOU WIN!"
 
-    # RETURN TO MENU
-    if button_pressed and game_state in ("GAME_OVER", "WIN"):
-        show_menu()
-
-    time.sleep(0.02)
+    display.refresh(target_frames_per_second=None)
+    time.sleep(FRAME_SLEEP)